@@ -1,5 +1,7 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+from setuptools.command.build_ext import build_ext
 from pathlib import Path
+import warnings
 
 # Read the contents of README file
 this_directory = Path(__file__).parent
@@ -16,6 +18,33 @@ if requirements_path.exists():
             if line.strip() and not line.startswith("#")
         ]
 
+# Optional compiled kinetics kernel. It is only built when Cython is available,
+# and a failed compilation falls back to the pure-Python package.
+ext_modules = []
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension("ChemCompute._kinetic_step", ["src/ChemCompute/_kinetic_step.pyx"])],
+        language_level=3,
+    )
+except ImportError:
+    pass
+
+
+class optional_build_ext(build_ext):
+    def run(self):
+        try:
+            super().run()
+        except Exception as error:
+            warnings.warn(f"Skipping the optional ChemCompute._kinetic_step extension: {error}")
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as error:
+            warnings.warn(f"Skipping the optional {ext.name} extension: {error}")
+
+
 setup(
     name="chemcompute",
     version="0.1.1",
@@ -44,7 +73,18 @@ setup(
     ],
     python_requires=">=3.7",
     install_requires=requirements,
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": optional_build_ext},
     extras_require={
+        "fast": [
+            "numba>=0.56.0",
+        ],
+        "scipy": [
+            "scipy>=1.4.0",
+        ],
+        "julia": [
+            "diffeqpy>=2.0.0",
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.0.0",
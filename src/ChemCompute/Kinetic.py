@@ -1,9 +1,456 @@
 from ._general import Enviroment
 import matplotlib
 import random
-from itertools import count
+import math
+from dataclasses import dataclass
 import numpy as np
 
+try:
+    import numba
+    from numba import prange
+except ImportError:  # numba is optional, the NumPy implementation is used without it
+    numba = None
+    prange = range
+
+try:
+    from . import _kinetic_step
+except ImportError:  # the Cython kernel is optional and only built when a compiler is available
+    _kinetic_step = None
+
+_SCIPY_METHODS = ["RK45", "RK23", "DOP853", "Radau", "BDF", "LSODA"]
+
+# `concentration_below_zero` policies, resolved once per run to the integer
+# mode passed to the compiled kernels
+_BELOW_ZERO_MODES = {"SetToZero": 0, "DoNotChange": 1, "GoNegetive": 2}
+# In-place state updates for each mode
+_BELOW_ZERO_UPDATES = (
+    lambda concentrations, change: np.maximum(np.add(concentrations, change, out=concentrations), 0, out=concentrations),
+    lambda concentrations, change: np.copyto(concentrations, concentrations + change, where=~(concentrations + change <= 0)),
+    lambda concentrations, change: np.add(concentrations, change, out=concentrations),
+)
+
+
+def _pad(rows, width, dtype):
+    """Pack ragged per-reaction lists into a zero-padded 2D array of shape `(len(rows), width)`."""
+    output_array = np.zeros((len(rows), width), dtype=dtype)
+    for i, row in enumerate(rows):
+        output_array[i, :len(row)] = row
+    return output_array
+
+
+def _repeat_by_order(index_rows, order_rows, max_order=3):
+    """
+    Repeat every species index by its rate dependency, so that `prod(C[repeated])`
+    equals `prod(C[index] ** order)` without evaluating any power.
+
+    Rows with an order that is not an integer between 0 and `max_order` are left
+    empty and flagged for the general power evaluation.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray] | None: Padded repeated
+        indices, their mask and whether each row was repeated, or None if no row was.
+    """
+    repeated_rows = []
+    integer = []
+    for index_row, order_row in zip(index_rows, order_rows):
+        is_integer = all(order == int(order) and 0 <= order <= max_order for order in order_row)
+        repeated = []
+        for index, order in zip(index_row, order_row if is_integer else []):
+            repeated += [index] * int(order)
+        repeated_rows.append(repeated)
+        integer.append(is_integer)
+    if not any(integer):
+        return None
+    width = max([1] + [len(row) for row in repeated_rows])
+    return (_pad(repeated_rows, width, np.int32),
+            _pad([[True] * len(row) for row in repeated_rows], width, bool),
+            np.array(integer, dtype=bool))
+
+
+# Networks with at least this many reactions evaluate their rates on all numba
+# threads; below it the cost of starting the threads outweighs the work
+_PARALLEL_MIN_REACTIONS = 1000
+# With reuse_tolerance="auto", reuse is switched off once more than this share
+# of rate evaluations has to be recomputed anyway
+_REUSE_MAX_RECOMPUTE = 0.9
+
+
+def _mass_action(concentrations, index, n_compounds, dependency, rate):
+    """Rate of one reaction side, `rate * prod(c ** order)` over its first `n_compounds` entries."""
+    if rate == 0.0:
+        return 0.0
+    for j in range(n_compounds):
+        c = concentrations[index[j]]
+        d = dependency[j]
+        if d == 1.0:
+            rate *= c
+        elif d == 2.0:
+            rate *= c * c
+        elif c == 0.0 and d < 0:
+            return 0.0
+        else:
+            rate *= math.pow(c, d)
+    return rate
+
+
+def _active_side(active, index, mask, dependency, rate_constant, repeated):
+    """
+    Arguments of `KineticalCalculator._side_rate` restricted to the `active` reactions.
+
+    `repeated` (from `_repeat_by_order`) becomes `(repeated_index, repeated_mask, general)`,
+    where `general` is None when every active reaction is repeated and otherwise the
+    `(rows, args)` of the reactions left to the power evaluation, relative to the active ones.
+
+    Returns:
+        tuple: `(rows, args)`, where `rows` holds the indices of the active reactions,
+        or is None (with `args` unrestricted) when every reaction is active.
+    """
+    rows = None if active.all() else np.flatnonzero(active)
+    if rows is not None:
+        index, mask, dependency, rate_constant = index[rows], mask[rows], dependency[rows], rate_constant[rows]
+    if repeated is not None:
+        repeated_index, repeated_mask, integer = (part if rows is None else part[rows] for part in repeated)
+        general = None
+        if not integer.all():
+            general_rows = np.flatnonzero(~integer)
+            general = (general_rows, (index[general_rows], mask[general_rows], dependency[general_rows],
+                                      rate_constant[general_rows]))
+        repeated = (repeated_index, repeated_mask, general)
+    return rows, (index, mask, dependency, rate_constant, repeated)
+
+
+def _rhs_reused(concentrations, concentration_change, reactant_idx, product_idx, n_r, n_p,
+                stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, reuse):
+    """
+    `_rhs` that reuses the rates of reaction sides whose concentrations barely changed.
+
+    `reuse` is `(tolerance, reference, cached, recomputed)`, indexed by side (0 forward,
+    1 backward) and reaction. While every concentration of a side is within the relative
+    `tolerance` of `reference[side, rxn]`, the concentration product `cached[side, rxn]`
+    computed there is reused; otherwise it is recomputed, stored and counted in
+    `recomputed[side, rxn]`. A side never computed has no reference yet (a NaN marker
+    would not survive fastmath).
+    """
+    tolerance, reference, cached, recomputed = reuse
+    concentration_change[:] = 0.0
+    for rxn in range(kf.shape[0]):
+        rates = (time_interval * kf[rxn], time_interval * kb[rxn])
+        net_rate = 0.0
+        for side in range(2):
+            if rates[side] == 0.0:
+                continue
+            index = reactant_idx if side == 0 else product_idx
+            n_compounds = n_r[rxn] if side == 0 else n_p[rxn]
+            unchanged = recomputed[side, rxn] > 0
+            for j in range(n_compounds if unchanged else 0):
+                value = reference[side, rxn, j]
+                if not abs(concentrations[index[rxn, j]] - value) <= tolerance * abs(value):
+                    unchanged = False
+                    break
+            if not unchanged:
+                for j in range(n_compounds):
+                    reference[side, rxn, j] = concentrations[index[rxn, j]]
+                cached[side, rxn] = _mass_action(concentrations, index[rxn], n_compounds,
+                                                 dep_r[rxn] if side == 0 else dep_p[rxn], 1.0)
+                recomputed[side, rxn] += 1
+            net_rate += rates[side] * cached[side, rxn] if side == 0 else -rates[side] * cached[side, rxn]
+        for j in range(n_r[rxn]):
+            concentration_change[reactant_idx[rxn, j]] -= net_rate * stoich_r[rxn, j]
+        for j in range(n_p[rxn]):
+            concentration_change[product_idx[rxn, j]] += net_rate * stoich_p[rxn, j]
+
+
+def _rhs_parallel(concentrations, concentration_change, reactant_idx, product_idx, n_r, n_p,
+                  stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval):
+    """
+    `_rhs` for large networks.
+
+    The net rate of every reaction is computed in parallel; the scatter into
+    `concentration_change` stays serial since reactions share compounds.
+    """
+    n_reactions = kf.shape[0]
+    net_rate = np.empty(n_reactions)
+    for rxn in prange(n_reactions):
+        net_rate[rxn] = (_mass_action(concentrations, reactant_idx[rxn], n_r[rxn], dep_r[rxn], time_interval * kf[rxn])
+                         - _mass_action(concentrations, product_idx[rxn], n_p[rxn], dep_p[rxn], time_interval * kb[rxn]))
+    concentration_change[:] = 0.0
+    for rxn in range(n_reactions):
+        for j in range(n_r[rxn]):
+            concentration_change[reactant_idx[rxn, j]] -= net_rate[rxn] * stoich_r[rxn, j]
+        for j in range(n_p[rxn]):
+            concentration_change[product_idx[rxn, j]] += net_rate[rxn] * stoich_p[rxn, j]
+
+
+def _rhs(concentrations, concentration_change, reactant_idx, product_idx, n_r, n_p,
+         stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval):
+    """Write the change of every compound over `time_interval` into `concentration_change`."""
+    concentration_change[:] = 0.0
+    for rxn in range(kf.shape[0]):
+        # The rate laws are written out rather than calling `_mass_action`, which
+        # would take a view of each index row on every call
+        rf = time_interval * kf[rxn]
+        for j in range(n_r[rxn] if rf != 0.0 else 0):
+            c = concentrations[reactant_idx[rxn, j]]
+            d = dep_r[rxn, j]
+            if d == 1.0:
+                rf *= c
+            elif d == 2.0:
+                rf *= c * c
+            elif c == 0.0 and d < 0:
+                rf = 0.0
+                break
+            else:
+                rf *= math.pow(c, d)
+        rb = time_interval * kb[rxn]
+        for j in range(n_p[rxn] if rb != 0.0 else 0):
+            c = concentrations[product_idx[rxn, j]]
+            d = dep_p[rxn, j]
+            if d == 1.0:
+                rb *= c
+            elif d == 2.0:
+                rb *= c * c
+            elif c == 0.0 and d < 0:
+                rb = 0.0
+                break
+            else:
+                rb *= math.pow(c, d)
+        for j in range(n_r[rxn]):
+            concentration_change[reactant_idx[rxn, j]] += (rb - rf) * stoich_r[rxn, j]
+        for j in range(n_p[rxn]):
+            concentration_change[product_idx[rxn, j]] += (rf - rb) * stoich_p[rxn, j]
+
+
+def _rates(concentrations, concentration_change, reactant_idx, product_idx, n_r, n_p,
+           stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, reuse, parallel):
+    """
+    Call `_rhs`, or `_rhs_reused` with the rate-reuse state `reuse` when it is not None,
+    or `_rhs_parallel` when `parallel` is not None.
+
+    Both are None or set rather than flags so that numba compiles only the branch
+    that is taken: the default kernel never pulls in the reusing or threaded one.
+    """
+    if reuse is not None:
+        _rhs_reused(concentrations, concentration_change, reactant_idx, product_idx, n_r, n_p,
+                    stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, reuse)
+    elif parallel is None:
+        _rhs(concentrations, concentration_change, reactant_idx, product_idx, n_r, n_p,
+             stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval)
+    else:
+        _rhs_parallel(concentrations, concentration_change, reactant_idx, product_idx, n_r, n_p,
+                      stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval)
+
+
+def _updated(value, change, mode):
+    """
+    New value of one concentration under the `concentration_below_zero` mode (see `_BELOW_ZERO_MODES`).
+
+    A NaN passes through, as in the NumPy updates of `_BELOW_ZERO_UPDATES`, rather
+    than being clamped away.
+    """
+    new_value = value + change
+    if mode == 0:
+        return 0.0 if new_value <= 0 else new_value
+    if mode == 1:
+        return value if new_value <= 0 else new_value
+    return new_value
+
+
+def _stage_value(value, mode):
+    """
+    Concentration an RK4 stage state passes to the rate law: clamped to zero unless
+    `mode` is 2 ("GoNegetive"), since a negative value has no real power of a fractional order.
+    """
+    return value if mode == 2 or value > 0 else 0.0
+
+
+def _step(concentrations, work, reactant_idx, product_idx, n_r, n_p,
+          stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, rk4, mode, reuse, parallel):
+    """
+    Advance `concentrations` in place by one step of length `time_interval`.
+
+    `work` is a preallocated `(5, n_compounds)` buffer. The step is forward Euler,
+    or classical RK4 when `rk4` is True. The full step, and the RK4 stage states,
+    are handled according to the integer `concentration_below_zero` mode (0 clamps
+    negative values to zero).
+    `reuse` and `parallel` are passed on to `_rates`.
+    """
+    if not rk4:
+        _rates(concentrations, work[0], reactant_idx, product_idx, n_r, n_p,
+               stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, reuse, parallel)
+        for k in range(concentrations.shape[0]):
+            concentrations[k] = _updated(concentrations[k], work[0, k], mode)
+    else:
+        stage = work[4]
+        _rates(concentrations, work[0], reactant_idx, product_idx, n_r, n_p,
+               stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, reuse, parallel)
+        for s in range(1, 4):
+            weight = 1.0 if s == 3 else 0.5
+            for k in range(concentrations.shape[0]):
+                stage[k] = _stage_value(concentrations[k] + weight * work[s - 1, k], mode)
+            _rates(stage, work[s], reactant_idx, product_idx, n_r, n_p,
+                   stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, reuse, parallel)
+        for k in range(concentrations.shape[0]):
+            concentrations[k] = _updated(concentrations[k],
+                                         (work[0, k] + 2 * work[1, k] + 2 * work[2, k] + work[3, k]) / 6, mode)
+
+
+def _integrate(concentrations, work, reactant_idx, product_idx, n_r, n_p,
+               stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, rk4, mode, first_step, n_steps,
+               checkpoint_times, checkpoints_out, history_out, reuse, parallel):
+    """
+    Run `n_steps` steps of `_step`, copying the state into `checkpoints_out` at each checkpoint.
+
+    Step `i` covers the time from `(first_step + i) * time_interval`, so a run can
+    be split into consecutive calls.
+
+    `checkpoint_times` must be sorted and non-negative; a single pointer walks
+    through it as time advances.
+
+    If `history_out` has rows, the state after step `i` is stored in row `i + 1`
+    (row 0 holds the initial state and is filled by the caller).
+
+    Returns:
+        int: Number of rows written to `checkpoints_out`.
+    """
+    hits = 0
+    n_checkpoints = checkpoint_times.shape[0]
+    for i in range(n_steps):
+        t = (first_step + i) * time_interval
+        _step(concentrations, work, reactant_idx, product_idx, n_r, n_p,
+              stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, rk4, mode, reuse, parallel)
+        if history_out.shape[0] > 0:
+            history_out[i + 1, :] = concentrations
+        while hits < n_checkpoints and checkpoint_times[hits] < t + time_interval:
+            checkpoints_out[hits, :] = concentrations
+            hits += 1
+    return hits
+
+
+if numba is not None:
+    _mass_action = numba.njit(cache=True, fastmath=True)(_mass_action)
+    _rhs_reused = numba.njit(cache=True, fastmath=True)(_rhs_reused)
+    _rhs_parallel = numba.njit(cache=True, fastmath=True, parallel=True)(_rhs_parallel)
+    _rhs = numba.njit(cache=True, fastmath=True)(_rhs)
+    # Inlined, since a call passing this many arrays costs as much as a small network's rates
+    _rates = numba.njit(cache=True, fastmath=True, inline="always")(_rates)
+    # Without the "nnan" flag of fastmath=True, so that NaN comparisons stay defined
+    _updated = numba.njit(cache=True, fastmath={"nsz", "arcp", "contract", "afn", "reassoc"})(_updated)
+    _stage_value = numba.njit(cache=True, fastmath=True)(_stage_value)
+    _step = numba.njit(cache=True, fastmath=True)(_step)
+    _integrate = numba.njit(cache=True, fastmath=True)(_integrate)
+
+# Networks up to this size get a kernel generated for their exact structure
+_UNROLL_MAX_SPECIES = 16
+_UNROLL_MAX_REACTIONS = 32
+# Generated kernels are compiled on first use (under a second), which only pays
+# off once steps * reactions reaches this amount of work
+_UNROLL_MIN_WORK = 10000000
+_UNROLLED_CACHE = {}
+
+
+def _power_source(name, order):
+    """Source code for `name ** order`, using multiplications for small integer orders."""
+    if order == 1:
+        return name
+    if order in (2, 3):
+        return " * ".join([name] * int(order))
+    return f"math.pow({name}, {float(order)!r})"
+
+
+def _rate_source(rate_constant, side):
+    """Source code for one side's rate, `k * prod(c ** order)` with the zero-concentration guard."""
+    factors = [rate_constant] + [_power_source(f"c{index}", order) for index, _, order in side if order != 0]
+    expression = " * ".join(factors)
+    blocked = [f"c{index} == 0.0" for index, _, order in side if order < 0]
+    if blocked:
+        expression = f"0.0 if ({' or '.join(blocked)}) else {expression}"
+    return expression
+
+
+def _unrolled_integrate(structure):
+    """
+    Generate and compile an `_integrate` equivalent specialized to one reaction network.
+
+    The state is held in scalar locals `c0, c1, ...` and every reaction's rate law
+    is written out, so numba can keep the whole state in registers. `structure` is
+    `(n_species, reactions)` with each reaction `(reactants, products, (has_fwd, has_rev))`,
+    each side a tuple of `(species_index, stoichiometric_coefficient, rate_dependency)`
+    and the flags False for a side whose rate constant is zero, which is left out.
+    Compiled kernels are cached by structure; nonzero rate constants stay arguments
+    so a temperature change does not recompile.
+
+    The returned function takes `(concentrations, work, kf, kb, time_interval, rk4,
+    mode, first_step, n_steps, checkpoint_times, checkpoints_out, history_out)`.
+    """
+    if structure in _UNROLLED_CACHE:
+        return _UNROLLED_CACHE[structure]
+    n_species, reactions = structure
+    species = [f"c{k}" for k in range(n_species)]
+    state = ", ".join(species)
+    net_change = [[] for _ in range(n_species)]
+    rhs_lines = [f"def rhs({state}, kf, kb, dt):"]
+    for rxn, (reactants, products, (has_fwd, has_rev)) in enumerate(reactions):
+        rhs_lines.append(f"    rf{rxn} = {_rate_source(f'dt * kf[{rxn}]', reactants) if has_fwd else '0.0'}")
+        rhs_lines.append(f"    rb{rxn} = {_rate_source(f'dt * kb[{rxn}]', products) if has_rev else '0.0'}")
+        for index, coefficient, _ in reactants:
+            net_change[index].append(f"({coefficient!r}) * (rb{rxn} - rf{rxn})")
+        for index, coefficient, _ in products:
+            net_change[index].append(f"({coefficient!r}) * (rf{rxn} - rb{rxn})")
+    changes = [" + ".join(terms) if terms else "0.0" for terms in net_change]
+    rhs_lines.append(f"    return ({', '.join(changes)},)")
+
+    def stage(weight, k):
+        return ", ".join(f"stage_value(c{j} + {weight} * {k}[{j}], mode)" for j in range(n_species))
+
+    integrate_lines = [
+        "def integrate(concentrations, work, kf, kb, time_interval, rk4, mode, first_step, n_steps,",
+        "              checkpoint_times, checkpoints_out, history_out):",
+        *[f"    c{k} = concentrations[{k}]" for k in range(n_species)],
+        "    hits = 0",
+        "    n_checkpoints = checkpoint_times.shape[0]",
+        "    for i in range(n_steps):",
+        "        t = (first_step + i) * time_interval",
+        f"        k1 = rhs({state}, kf, kb, time_interval)",
+        "        if rk4:",
+        f"            k2 = rhs({stage(0.5, 'k1')}, kf, kb, time_interval)",
+        f"            k3 = rhs({stage(0.5, 'k2')}, kf, kb, time_interval)",
+        f"            k4 = rhs({stage(1.0, 'k3')}, kf, kb, time_interval)",
+        *[f"            c{k} = updated(c{k}, (k1[{k}] + 2 * k2[{k}] + 2 * k3[{k}] + k4[{k}]) / 6, mode)" for k in range(n_species)],
+        "        else:",
+        *[f"            c{k} = updated(c{k}, k1[{k}], mode)" for k in range(n_species)],
+        "        if history_out.shape[0] > 0:",
+        *[f"            history_out[i + 1, {k}] = c{k}" for k in range(n_species)],
+        "        while hits < n_checkpoints and checkpoint_times[hits] < t + time_interval:",
+        *[f"            checkpoints_out[hits, {k}] = c{k}" for k in range(n_species)],
+        "            hits += 1",
+        *[f"    concentrations[{k}] = c{k}" for k in range(n_species)],
+        "    return hits",
+    ]
+    namespace = {"math": math, "updated": _updated, "stage_value": _stage_value}
+    exec("\n".join(rhs_lines), namespace)
+    namespace["rhs"] = numba.njit(fastmath=True)(namespace["rhs"])
+    exec("\n".join(integrate_lines), namespace)
+    integrate = numba.njit(fastmath=True)(namespace["integrate"])
+    _UNROLLED_CACHE[structure] = integrate
+    return integrate
+
+
+@dataclass
+class KineticResult:
+    """
+    States recorded by a `KineticalCalculator` run, as arrays.
+
+    Attributes:
+        times (numpy.ndarray): Time of each recorded state: the checkpoints reached, then the end of the run.
+            For the fixed-step methods these are the ends of the steps that recorded them.
+        C (numpy.ndarray): Concentrations of shape `(len(times), n_compounds)`, one row per entry of `times`.
+        names (list[str]): Unicode formula of each compound, in column order.
+    """
+    times: np.ndarray
+    C: np.ndarray
+    names: list
+
+
 class KineticalCalculator:
     """
     Simulates chemical reaction kinetics within an Enviroment instance.
@@ -12,7 +459,13 @@ class KineticalCalculator:
     using the rate constants and stoichiometric relationships defined in an `Enviroment` object.
 
     Attributes:
-        accuracy (float): Time step for numerical integration (default: 1e-3).
+        accuracy (float): Time step for numerical integration (default: 1e-3, or 1e-1 for "rk4").
+        method (str): Integration method, "euler", "rk4" or one of the `scipy.integrate.solve_ivp` methods.
+        reuse_tolerance (float or str): Relative change below which rates are reused, or "auto".
+        recompute_fraction (float): Share of rate evaluations recomputed rather than reused since `fit`.
+        backend (str): "python" or "julia", the library that runs the adaptive methods.
+        rtol (float): Relative tolerance for the `solve_ivp` methods.
+        atol (float): Absolute tolerance for the `solve_ivp` methods.
         fitted (bool): Indicates whether the calculator has been linked to an `Enviroment` instance.
         enviroment (Enviroment): The fitted reaction environment (after calling `fit`).
         rate_constants (list[list[float]]): List of forward and backward rate constants for each reaction.
@@ -22,16 +475,54 @@ class KineticalCalculator:
         number_of_reactions (int): Number of reactions in the environment.
         concentrations (list[float]): Current concentration values for each compound in the environment.
     """
-    def __init__(self , accuracy = 1e-3):
+    def __init__(self , accuracy = None , method = "euler" , rtol = 1e-6 , atol = 1e-9 , backend = "python" , reuse_tolerance = 0.0):
         """
         Initialize the kinetic calculator with a specified numerical accuracy.
 
         Args:
             accuracy (float, optional): Time step (Δt) for concentration updates.
                 Smaller values yield higher accuracy but slower computation.
-                Default is 1e-3.
+                Default is 1e-3 for "euler" and 1e-1 for "rk4".
+            method (str, optional): Integration method. Options:
+                - "euler": Fixed-step forward Euler with step `accuracy` (default).
+                - "rk4": Fixed-step classical Runge-Kutta. Its error is O(Δt⁴), so
+                  much larger steps than Euler give the same accuracy.
+                - "LSODA", "BDF", "Radau", "RK45", "RK23", "DOP853": Adaptive
+                  integration with `scipy.integrate.solve_ivp` (requires scipy).
+                  "LSODA" and "BDF" are recommended for stiff reaction networks.
+            rtol (float, optional): Relative tolerance for the `solve_ivp` methods. Default is 1e-6.
+            atol (float, optional): Absolute tolerance for the `solve_ivp` methods. Default is 1e-9.
+            backend (str, optional): Where adaptive methods run. Options:
+                - "python": `scipy.integrate.solve_ivp` (default).
+                - "julia": Julia's DifferentialEquations.jl through `diffeqpy`. The stiff
+                  methods ("LSODA", "BDF", "Radau") use `FBDF()`, the others `Tsit5()`.
+            reuse_tolerance (float or str, optional): Relative concentration change below which
+                a reaction side's rate from an earlier evaluation is reused instead of recomputed,
+                which saves work on slow reactions. 0 (default) always recomputes. "auto" uses
+                `1e-3 * accuracy` and stops reusing if almost every rate has to be recomputed.
+                Only the numba kernel reuses rates.
+
+        Raises:
+            ValueError: If `method` is not "euler", "rk4" or a supported `solve_ivp` method.
+            ValueError: If `backend` is not "python" or "julia", or "julia" is used with a fixed-step method.
+            ValueError: If `reuse_tolerance` is negative or not a number or "auto".
         """
+        if not method in ["euler", "rk4"] + _SCIPY_METHODS:
+            raise ValueError(f"`method` is not one of {['euler', 'rk4'] + _SCIPY_METHODS}.")
+        if not backend in ["python", "julia"]:
+            raise ValueError("`backend` is not one of ['python', 'julia'].")
+        if backend == "julia" and not method in _SCIPY_METHODS:
+            raise ValueError(f"backend='julia' requires an adaptive method, one of {_SCIPY_METHODS}.")
+        if not (reuse_tolerance == "auto" or isinstance(reuse_tolerance, (int, float)) and reuse_tolerance >= 0):
+            raise ValueError("`reuse_tolerance` must be a non-negative number or 'auto'.")
+        if accuracy is None:
+            accuracy = 1e-1 if method == "rk4" else 1e-3
         self.accuracy = accuracy
+        self.reuse_tolerance = reuse_tolerance
+        self.method = method
+        self.rtol = rtol
+        self.atol = atol
+        self.backend = backend
         self.fitted = False
     def fit(self , enviroment):
         """
@@ -55,9 +546,413 @@ class KineticalCalculator:
         self.concentrations = []
         for compound in enviroment.compounds_concentration :
             self.concentrations.append(compound["concentration"])
+
+        # Structure-of-arrays view of the reaction network: one row per reaction,
+        # padded to the widest reaction side, with a mask marking real entries.
+        reactants_index = [rxn[0] for rxn in self.reactions_by_index]
+        products_index = [rxn[1] for rxn in self.reactions_by_index]
+        max_species_per_side = max([1] + [len(side) for side in reactants_index + products_index])
+        self._reactant_idx = _pad(reactants_index, max_species_per_side, np.int32)
+        self._product_idx = _pad(products_index, max_species_per_side, np.int32)
+        self._mask_r = _pad([[True] * len(side) for side in reactants_index], max_species_per_side, bool)
+        self._mask_p = _pad([[True] * len(side) for side in products_index], max_species_per_side, bool)
+        self._stoich_r = _pad([rxn[0] for rxn in self.stoichiometric_coefficient_by_reaction], max_species_per_side, np.float64)
+        self._stoich_p = _pad([rxn[1] for rxn in self.stoichiometric_coefficient_by_reaction], max_species_per_side, np.float64)
+        self._dep_r = _pad([rxn[0] for rxn in self.rate_dependency_by_reaction], max_species_per_side, np.float64)
+        self._dep_p = _pad([rxn[1] for rxn in self.rate_dependency_by_reaction], max_species_per_side, np.float64)
+        rate_constants = np.array(self.rate_constants, dtype=np.float64).reshape(-1, 2)
+        self._kf = np.ascontiguousarray(rate_constants[:, 0])
+        self._kb = np.ascontiguousarray(rate_constants[:, 1])
+        # Sides with a zero rate constant (e.g. the reverse of an irreversible
+        # reaction) contribute nothing, so their rate laws are never evaluated
+        self._has_fwd = self._kf != 0
+        self._has_rev = self._kb != 0
+        # Reaction sides whose orders are all small integers skip pow; the
+        # others keep the general power evaluation
+        self._repeated_r = _repeat_by_order(reactants_index, [rxn[0] for rxn in self.rate_dependency_by_reaction])
+        self._repeated_p = _repeat_by_order(products_index, [rxn[1] for rxn in self.rate_dependency_by_reaction])
+        # Sparsity pattern of the Jacobian: compound `row` changes with every species
+        # `col` on either side of a reaction it takes part in. `_jac_src` points into
+        # the flattened [forward, backward] rate derivatives of `jacobian`.
+        number_of_slots = self.number_of_reactions * max_species_per_side
+        jac_rows, jac_cols, jac_coef, jac_src = [], [], [], []
+        for rxn in range(self.number_of_reactions):
+            net_coefficients = {}
+            for index, coefficient in zip(reactants_index[rxn], self.stoichiometric_coefficient_by_reaction[rxn][0]):
+                net_coefficients[index] = net_coefficients.get(index, 0) - coefficient
+            for index, coefficient in zip(products_index[rxn], self.stoichiometric_coefficient_by_reaction[rxn][1]):
+                net_coefficients[index] = net_coefficients.get(index, 0) + coefficient
+            for row, coefficient in net_coefficients.items():
+                if coefficient == 0:
+                    continue
+                for j, col in enumerate(reactants_index[rxn]):
+                    jac_rows.append(row)
+                    jac_cols.append(col)
+                    jac_coef.append(coefficient)
+                    jac_src.append(rxn * max_species_per_side + j)
+                for j, col in enumerate(products_index[rxn]):
+                    jac_rows.append(row)
+                    jac_cols.append(col)
+                    jac_coef.append(-coefficient)
+                    jac_src.append(number_of_slots + rxn * max_species_per_side + j)
+        self._jac_rows = np.array(jac_rows, dtype=np.int32)
+        self._jac_cols = np.array(jac_cols, dtype=np.int32)
+        self._jac_coef = np.array(jac_coef, dtype=np.float64)
+        self._jac_src = np.array(jac_src, dtype=np.int64)
+        self._jac_data = np.empty(len(jac_src))
+        # Argument tuples for the vectorized rate law, bound once so a step does
+        # not repeat a dozen attribute lookups. Each is `(rows, args)`, with the
+        # arguments restricted to the reactions whose rate constant is nonzero
+        # (`rows` is None when that is all of them).
+        self._forward = _active_side(self._has_fwd, self._reactant_idx, self._mask_r, self._dep_r, self._kf, self._repeated_r)
+        self._backward = _active_side(self._has_rev, self._product_idx, self._mask_p, self._dep_p, self._kb, self._repeated_p)
+        self._scatter = (self._reactant_idx, self._stoich_r, self._product_idx, self._stoich_p)
+        # Buffers reused by every time step: the state, and the per-stage changes
+        self._C = np.array([compound["concentration"] for compound in enviroment.compounds_concentration], dtype=np.float64)
+        self._work = np.zeros((5, len(self._C)))
+        # Arguments of the compiled kernels, which loop over the first n_r / n_p
+        # entries of each row instead of using the masks
+        n_r = np.array([len(side) for side in reactants_index], dtype=np.int32)
+        n_p = np.array([len(side) for side in products_index], dtype=np.int32)
+        # Key for the kernel generated for small networks by `_unrolled_integrate`,
+        # with plain Python numbers since their repr is written into its source
+        self._structure = None
+        if len(self._C) <= _UNROLL_MAX_SPECIES and self.number_of_reactions <= _UNROLL_MAX_REACTIONS:
+            self._structure = (len(self._C), tuple(
+                tuple(tuple((int(i), float(c), float(d)) for i, c, d in zip(index[side], coefficient[side], dependency[side]))
+                      for side in range(2))
+                + ((bool(has_fwd), bool(has_rev)),)
+                for index, coefficient, dependency, has_fwd, has_rev in zip(self.reactions_by_index,
+                                                                            self.stoichiometric_coefficient_by_reaction,
+                                                                            self.rate_dependency_by_reaction,
+                                                                            self._has_fwd, self._has_rev)))
+        self._network = (self._reactant_idx, self._product_idx, n_r, n_p,
+                         self._stoich_r, self._stoich_p, self._dep_r, self._dep_p, self._kf, self._kb)
+        # Rate-reuse state of the numba kernel (see `_rhs_reused`)
+        tolerance = 1e-3 * self.accuracy if self.reuse_tolerance == "auto" else float(self.reuse_tolerance)
+        self._reuse = (tolerance,
+                       np.zeros((2, self.number_of_reactions, max_species_per_side)),
+                       np.zeros((2, self.number_of_reactions)),
+                       np.zeros((2, self.number_of_reactions), dtype=np.int64))
+        self._rate_evaluations = 0
+        self.recompute_fraction = 1.0
         self.fitted = True
 
-    def calculate(self  , time , checkpoint_time = [] , plot = False , directory = "./plot.png", colors = None):
+    def _refit_if_changed(self):
+        """
+        Re-run `fit` if the environment's network changed since the last fit.
+
+        `fit` builds its arrays from a snapshot of the environment, which goes stale
+        when the temperature changes the rate constants or a reaction is added.
+        """
+        enviroment = self.enviroment
+        if (enviroment.rate_constants != self.rate_constants
+                or len(enviroment.compounds) != len(self.concentrations)
+                or enviroment.reaction_by_index != self.reactions_by_index
+                or enviroment.stoichiometric_coefficient_by_reaction != self.stoichiometric_coefficient_by_reaction
+                or enviroment.rate_dependency_by_reaction != self.rate_dependency_by_reaction):
+            self.fit(enviroment)
+
+    @staticmethod
+    def _side_rate(concentrations, index, mask, dependency, rate_constant, repeated=None):
+        """
+        Evaluate `k * prod(C[index] ** dependency)` for one side of every reaction.
+
+        A species with zero concentration and a negative rate dependency stops
+        the reaction instead of producing an infinite rate. When `repeated`
+        (see `_active_side`) is given, the powers of its repeated reactions are
+        plain products.
+        """
+        if repeated is not None:
+            repeated_index, repeated_mask, general = repeated
+            rate = rate_constant * np.where(repeated_mask, concentrations[repeated_index], 1.0).prod(axis=1)
+            if general is not None:
+                rows, args = general
+                rate[rows] = KineticalCalculator._side_rate(concentrations, *args)
+            return rate
+        side_concentrations = concentrations[index]
+        blocked = mask & (side_concentrations == 0) & (dependency < 0)
+        terms = np.where(mask & ~blocked, side_concentrations, 1.0) ** dependency
+        rate = rate_constant * terms.prod(axis=1)
+        rate[blocked.any(axis=1)] = 0
+        return rate
+
+    @staticmethod
+    def _side_rate_derivative(concentrations, index, mask, dependency, rate_constant):
+        """
+        Derivative of `k * prod(C[index] ** dependency)` with respect to each entry of `index`.
+
+        Products over the other species are built from prefix and suffix
+        cumulative products, so zero concentrations need no division. Orders
+        below one at zero concentration, where the derivative is unbounded,
+        are treated as zero.
+        """
+        side_concentrations = concentrations[index]
+        blocked = mask & (side_concentrations == 0) & (dependency < 0)
+        terms = np.where(mask & ~blocked, side_concentrations, 1.0) ** dependency
+        ones = np.ones((terms.shape[0], 1))
+        left = np.cumprod(np.hstack([ones, terms[:, :-1]]), axis=1)
+        right = np.cumprod(np.hstack([ones, terms[:, :0:-1]]), axis=1)[:, ::-1]
+        singular = (side_concentrations == 0) & (dependency < 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            own_term = np.where(mask & ~singular, side_concentrations, 1.0) ** (dependency - 1)
+        derivative = rate_constant[:, None] * dependency * own_term * left * right
+        derivative[~mask | singular] = 0
+        derivative[blocked.any(axis=1)] = 0
+        return derivative
+
+    def jacobian(self, t, concentrations, lower_bound=0):
+        """
+        Analytic Jacobian `d(dC/dt)/dC` of the rate equations.
+
+        The sparsity pattern is built once in `fit` from the stoichiometry, so each
+        call only evaluates the rate-law derivatives. The signature matches the
+        `jac` argument of `scipy.integrate.solve_ivp`.
+
+        Args:
+            t (float): Time (unused, the rate equations are autonomous).
+            concentrations (numpy.ndarray): Concentrations at which to evaluate the Jacobian.
+            lower_bound (float, optional): Concentrations are clamped to at least this value
+                first; `-numpy.inf` evaluates them as they are.
+
+        Returns:
+            scipy.sparse.csr_matrix: Matrix of shape `(n_compounds, n_compounds)` where entry
+            `[i, j]` is the derivative of the rate of change of compound `i` with respect
+            to the concentration of compound `j`.
+
+        Raises:
+            NameError: If the model has not been fitted to an environment.
+            ImportError: If scipy is not installed.
+        """
+        if not self.fitted :
+            raise NameError("You should fit the model to an enviromt object before calculation")
+        try:
+            from scipy.sparse import coo_matrix
+        except ImportError:
+            raise ImportError("The Jacobian requires scipy. Install it with `pip install scipy`.")
+        concentrations = np.maximum(concentrations, lower_bound)
+        drf = self._side_rate_derivative(concentrations, self._reactant_idx, self._mask_r, self._dep_r, self._kf)
+        drb = self._side_rate_derivative(concentrations, self._product_idx, self._mask_p, self._dep_p, self._kb)
+        derivatives = np.concatenate([drf.ravel(), drb.ravel()])
+        np.multiply(self._jac_coef, derivatives[self._jac_src], out=self._jac_data)
+        n = len(concentrations)
+        return coo_matrix((self._jac_data, (self._jac_rows, self._jac_cols)), shape=(n, n)).tocsr()
+
+    def _concentration_change(self, concentrations, time_interval, concentration_change):
+        """
+        Compute the concentration change of every compound over `time_interval`.
+
+        Args:
+            concentrations (numpy.ndarray): Current concentrations, ordered like `enviroment.compounds`.
+            time_interval (float): Length of the time step.
+            concentration_change (numpy.ndarray): Buffer that receives the result.
+
+        Returns:
+            numpy.ndarray: `concentration_change`, holding the change for each compound.
+        """
+        side_rate = self._side_rate
+        number_of_reactions = self.number_of_reactions
+        rows, args = self._forward
+        if rows is None:
+            rf = time_interval * side_rate(concentrations, *args)
+        else:
+            rf = np.zeros(number_of_reactions)
+            rf[rows] = time_interval * side_rate(concentrations, *args)
+        rows, args = self._backward
+        if rows is None:
+            rb = time_interval * side_rate(concentrations, *args)
+        else:
+            rb = np.zeros(number_of_reactions)
+            rb[rows] = time_interval * side_rate(concentrations, *args)
+        reactant_idx, stoich_r, product_idx, stoich_p = self._scatter
+        concentration_change[:] = 0
+        np.add.at(concentration_change, reactant_idx, (rb - rf)[:, None] * stoich_r)
+        np.add.at(concentration_change, product_idx, (rf - rb)[:, None] * stoich_p)
+        return concentration_change
+
+    def _increment(self, concentrations, mode=0):
+        """
+        Concentration change over one fixed step of length `self.accuracy`.
+
+        Uses forward Euler, or classical RK4 when `self.method` is "rk4", whose stage
+        states are clamped to zero unless `mode` is 2 ("GoNegetive"). The result lives
+        in the preallocated `self._work` buffer and is overwritten by the next call.
+        """
+        lower_bound = -np.inf if mode == 2 else 0
+        k1, k2, k3, k4, stage = self._work
+        concentration_change = self._concentration_change
+        time_interval = self.accuracy
+        concentration_change(concentrations, time_interval, k1)
+        if self.method != "rk4":
+            return k1
+        np.multiply(k1, 0.5, out=stage)
+        stage += concentrations
+        concentration_change(np.maximum(stage, lower_bound, out=stage), time_interval, k2)
+        np.multiply(k2, 0.5, out=stage)
+        stage += concentrations
+        concentration_change(np.maximum(stage, lower_bound, out=stage), time_interval, k3)
+        np.add(concentrations, k3, out=stage)
+        concentration_change(np.maximum(stage, lower_bound, out=stage), time_interval, k4)
+        k2 += k3
+        k2 *= 2
+        k1 += k2
+        k1 += k4
+        k1 /= 6
+        return k1
+
+    def _rate(self, t, concentrations, lower_bound=0):
+        """
+        Right-hand side `dC/dt` of the rate equations, in the form expected by `solve_ivp`.
+
+        Concentrations are clamped to at least `lower_bound` first.
+        """
+        return self._concentration_change(np.maximum(concentrations, lower_bound), 1.0, np.empty(len(concentrations)))
+
+    def _solve_ivp(self, concentrations, time, lower_bound):
+        """
+        Integrate the rate equations from 0 to `time` with `scipy.integrate.solve_ivp`.
+
+        The rate equations clamp the concentrations to at least `lower_bound`.
+
+        Returns:
+            tuple: `(times, states, interpolate)` with the solver's time points, the
+            states at those points (one row each) and a function of `t` giving the
+            interpolated state.
+
+        Raises:
+            ImportError: If scipy is not installed.
+            RuntimeError: If the solver fails.
+        """
+        try:
+            from scipy.integrate import solve_ivp
+        except ImportError:
+            raise ImportError(f"method='{self.method}' requires scipy. Install it with `pip install scipy`.")
+        # Implicit methods use the analytic Jacobian instead of finite differences,
+        # LSODA only accepts it as a dense array
+        options = {}
+        if self.method in ["Radau", "BDF"]:
+            options["jac"] = self.jacobian
+        elif self.method == "LSODA":
+            options["jac"] = lambda t, concentrations, lower_bound: self.jacobian(t, concentrations, lower_bound).toarray()
+        solution = solve_ivp(self._rate, (0, time), concentrations, method=self.method, args=(lower_bound,),
+                             dense_output=True, rtol=self.rtol, atol=self.atol, **options)
+        if not solution.success:
+            raise RuntimeError(f"Integration with method='{self.method}' failed: {solution.message}")
+        return solution.t, solution.y.T, solution.sol
+
+    def _solve_julia(self, concentrations, time, lower_bound):
+        """
+        Integrate the rate equations from 0 to `time` with DifferentialEquations.jl.
+
+        The rate equations and the analytic Jacobian are passed as Python callbacks
+        and clamp the concentrations to at least `lower_bound`, as for `_solve_ivp`.
+
+        Returns:
+            tuple: `(times, states, interpolate)`, as for `_solve_ivp`.
+
+        Raises:
+            ImportError: If diffeqpy is not installed.
+            RuntimeError: If the solver fails.
+        """
+        try:
+            from diffeqpy import de
+        except ImportError:
+            raise ImportError("backend='julia' requires diffeqpy. Install it with `pip install diffeqpy`.")
+        function = de.ODEFunction(lambda u, p, t: self._rate(t, np.asarray(u), lower_bound),
+                                  jac=lambda u, p, t: self.jacobian(t, np.asarray(u), lower_bound).toarray())
+        problem = de.ODEProblem(function, concentrations, (0.0, float(time)))
+        solver = de.FBDF() if self.method in ["LSODA", "BDF", "Radau"] else de.Tsit5()
+        solution = de.solve(problem, solver, abstol=self.atol, reltol=self.rtol)
+        if not de.SciMLBase.successful_retcode(solution):
+            raise RuntimeError(f"Integration with backend='julia' failed: {solution.retcode}")
+        states = np.array([np.asarray(u) for u in solution.u])
+        return np.asarray(solution.t), states, lambda t: np.asarray(solution(t))
+
+    def _advance(self, concentrations, first_step, n_steps, mode, checkpoint_times, checkpoints_out, history_out):
+        """
+        Advance `concentrations` in place by `n_steps` fixed steps.
+
+        This is the time loop shared by `calculate` and `calculate_responsively`. It runs
+        in compiled code (numba, or the Cython extension) when available and in a NumPy
+        loop otherwise.
+
+        Args:
+            concentrations (numpy.ndarray): State, updated in place.
+            first_step (int): Index of the first step; step `i` starts at `(first_step + i) * accuracy`.
+            n_steps (int): Number of steps to take.
+            mode (int): `concentration_below_zero` mode (see `_BELOW_ZERO_MODES`).
+            checkpoint_times (numpy.ndarray): Sorted checkpoint times not reached yet.
+            checkpoints_out (numpy.ndarray): Rows receiving the state at each checkpoint reached.
+            history_out (numpy.ndarray): If it has rows, row `i + 1` receives the state after step `i`.
+
+        Returns:
+            int: Number of checkpoints reached.
+        """
+        integrate = _integrate if numba is not None else getattr(_kinetic_step, "integrate", None)
+        network = self._network
+        # The general numba kernel is compiled separately with the rate-reuse state,
+        # when reuse is on, and with the thread-parallel rates for large networks.
+        # It is the only kernel that reuses rates, so the unrolled one is skipped
+        # while reuse is on.
+        reuse = self._reuse if numba is not None and self._reuse[0] > 0 else None
+        parallel = True if self.number_of_reactions >= _PARALLEL_MIN_REACTIONS else None
+        extra = (reuse, parallel) if numba is not None else ()
+        if (numba is not None and reuse is None and self._structure is not None
+                and n_steps * max(1, self.number_of_reactions) >= _UNROLL_MIN_WORK):
+            integrate = _unrolled_integrate(self._structure)
+            network = (self._kf, self._kb)
+            extra = ()
+        if integrate is not None:
+            hits = integrate(concentrations, self._work, *network, self.accuracy, self.method == "rk4", mode,
+                             first_step, n_steps, checkpoint_times, checkpoints_out, history_out, *extra)
+            if reuse is not None:
+                # Sides with a zero rate constant are never evaluated, so they are not counted
+                active_sides = int(self._has_fwd.sum() + self._has_rev.sum())
+                self._rate_evaluations += n_steps * (4 if self.method == "rk4" else 1) * active_sides
+                self.recompute_fraction = self._reuse[3].sum() / self._rate_evaluations
+                if self.reuse_tolerance == "auto" and self.recompute_fraction > _REUSE_MAX_RECOMPUTE:
+                    self._reuse = (0.0,) + self._reuse[1:]
+            return hits
+        update = _BELOW_ZERO_UPDATES[mode]
+        increment = self._increment
+        time_interval = self.accuracy
+        checkpoint_times = checkpoint_times.tolist()
+        n_checkpoints = len(checkpoint_times)
+        record_history = len(history_out) > 0
+        hits = 0
+        for i in range(n_steps):
+            # Time from the step index, not a running sum, so long runs do not drift
+            t = (first_step + i) * time_interval
+            update(concentrations, increment(concentrations, mode))
+            if record_history:
+                history_out[i + 1] = concentrations
+            while hits < n_checkpoints and checkpoint_times[hits] < t + time_interval:
+                checkpoints_out[hits] = concentrations
+                hits += 1
+        return hits
+
+    def _step_end_times(self, checkpoint_times):
+        """
+        End time of the step that records each checkpoint in `_advance`.
+
+        That is the first step `i` with `checkpoint < i * accuracy + accuracy`; the
+        estimate from a division is corrected by one step where rounding misses it.
+        """
+        time_interval = self.accuracy
+        steps = np.floor(np.asarray(checkpoint_times, dtype=np.float64) / time_interval)
+        steps += steps * time_interval + time_interval <= checkpoint_times
+        steps -= (steps > 0) & ((steps - 1) * time_interval + time_interval > checkpoint_times)
+        return steps * time_interval + time_interval
+
+    def _result(self, checkpoints, checkpoint_times, end_time, concentrations, legacy_format):
+        """Package the checkpoint states and the final state as a list of arrays, or as a `KineticResult`."""
+        if legacy_format:
+            return list(checkpoints) + [concentrations.copy()]
+        return KineticResult(times=np.append(np.asarray(checkpoint_times, dtype=np.float64), end_time),
+                             C=np.vstack([*checkpoints, concentrations]),
+                             names=[compound.unicode_formula for compound in self.enviroment.compounds])
+
+    def calculate(self  , time , checkpoint_time = [] , plot = False , directory = "./plot.png", colors = None , concentration_below_zero = "SetToZero" , legacy_format = True):
         """
         Numerically integrate the reaction kinetics over a specified time interval.
 
@@ -77,19 +972,35 @@ class KineticalCalculator:
             colors (list, optional): List of colors for plotting, one per compound.
                 Each color can be a string (e.g., 'red', 'blue') or RGB tuple (e.g., (0.5, 0.3, 0.8)).
                 If None, random colors are generated. Must have length equal to number of compounds.
+            concentration_below_zero (str, optional): What to do when a step would make a
+                concentration negative. Options:
+                - "SetToZero": Clamp the concentration to zero (default).
+                - "DoNotChange": Keep the concentration from before the step.
+                - "GoNegetive": Allow negative concentrations.
+                Adaptive methods evaluate the rates at concentrations clamped to zero and
+                clamp their output, except with "GoNegetive"; "DoNotChange" behaves like
+                "SetToZero" for them.
+            legacy_format (bool, optional): If True (default), return a list of arrays;
+                if False, return a `KineticResult`.
 
         Returns:
-            list[list]: List of checkpoints, where each entry is `[time, concentrations]`.
-                The first entry includes the header `["time", compound_unicode_formulas]`.
+            list[numpy.ndarray] or KineticResult: With `legacy_format`, the concentrations at each
+                checkpoint reached, in time order, followed by the final concentrations.
+                Otherwise the same states as a `KineticResult` with their times and compound names.
 
         Raises:
             NameError: If the model has not been fitted to an environment (i.e., `fit` not called).
             ValueError: If an invalid plotting mode or directory is provided.
             ValueError: If `plot` is not one of [False, "save", "interactive"].
+            ValueError: If `concentration_below_zero` is not one of the options above.
 
         Behavior:
-            - Concentrations are clamped to zero if they become negative.
+            - Negative concentrations are handled according to `concentration_below_zero`.
+            - With an adaptive `method`, checkpoints are interpolated from the
+              solver's dense output and `self.accuracy` is not used.
             - Supports recording concentrations at arbitrary checkpoint times.
+            - Changes to the environment since `fit` (e.g. of `T`, or added reactions)
+              are picked up by fitting again.
             - Interactive plotting allows the user to type 'exit' to close the plot.
 
         Example:
@@ -99,8 +1010,12 @@ class KineticalCalculator:
         """
         if not self.fitted :
             raise NameError("You should fit the model to an enviromt object before calculation")
+        self._refit_if_changed()
         if not plot in [False , "save" , "interactive"]:
             raise ValueError("`plot` is not one of [False, 'save', 'interactive'].")
+        mode = _BELOW_ZERO_MODES.get(concentration_below_zero)
+        if mode is None:
+            raise ValueError(f"`concentration_below_zero` is not one of {list(_BELOW_ZERO_MODES)}.")
         
         if plot == "interactive" :
             matplotlib.use("TkAgg", force=True)
@@ -127,46 +1042,42 @@ class KineticalCalculator:
             
             plt.xlabel("time")
             plt.ylabel("concentration")
-        concentrations = self.enviroment.concentrations_array
-        rate_dependencies = self.enviroment.rate_dependency_array
-        stoichiometric_coefficient = self.enviroment.stoichiometric_coefficient_array
-        rate_constants = self.enviroment.rate_constants_array
-        time_interval = self.accuracy
-        eps = 1e-300
-        def calculate_rf():
-            # rf = kf * prod_j concentrations[j]^order_fwd[j]
-            # Use log form for numerical stability and speed
-            log_c = np.log(concentrations + eps)
-            log_prod = rate_dependencies[:, 0, :] @ log_c  # (R,)
-            rf = np.exp(log_prod) * rate_constants[:, 0] * time_interval
-            return rf
-        def calculate_rb():
-            log_c = np.log(concentrations + eps)
-            log_prod = rate_dependencies[:, 1, :] @ log_c  # (R,)
-            rb = np.exp(log_prod) * rate_constants[:, 1] * time_interval
-            return rb
-        def calculate_concentration_change():
-            # rate vector for reactions
-            rate = -(calculate_rf() - calculate_rb())  # (R,)
-            # concentration change = stoich^T @ rate
-            concentration_change = stoichiometric_coefficient.T @ rate  # (C,)
-            return concentration_change.reshape(-1)
-        t = 0
-        for i in range(int(time/self.accuracy+1)):
-            new_conentratinos = np.add(concentrations, calculate_concentration_change())
-            new_conentratinos[new_conentratinos < 0] = 0
+        concentrations = self._C
+        concentrations[:] = self.enviroment.concentrations_array
+        n_steps = int(time/self.accuracy+1)
+        # Checkpoints are visited in time order; ones before the start are never reached
+        checkpoint_sorted = sorted(checkpoint_t for checkpoint_t in checkpoint_time if checkpoint_t >= 0)
+        if self.method in _SCIPY_METHODS:
+            solve = self._solve_julia if self.backend == "julia" else self._solve_ivp
+            # "GoNegetive" integrates the unclamped rate equations; the other
+            # modes clamp the state the rates see as well as the output
+            lower_bound = -np.inf if mode == 2 else 0
+            history_t, history_concentrations, interpolate = solve(concentrations, time, lower_bound)
+            checkpoint_reached = [checkpoint_t for checkpoint_t in checkpoint_sorted if checkpoint_t <= time]
+            for checkpoint_t in checkpoint_reached:
+                checkpoints.append(np.maximum(interpolate(checkpoint_t), lower_bound))
+            history_concentrations = np.maximum(history_concentrations, lower_bound)
+            concentrations = history_concentrations[-1]
+            end_time = time
+        else:
+            # The trajectory is recorded here and drawn once after the loop; the
+            # state after step i is plotted at time (i + 1) * accuracy, as in `KineticResult`.
+            history_t = np.arange(n_steps + 1) * self.accuracy
+            history_concentrations = np.empty((n_steps + 1 if plot else 0, len(concentrations)))
             if plot :
-                for k in range(len(self.concentrations)):
-                    plt.plot([t , t-self.accuracy],[new_conentratinos[k] , concentrations[k]] , color = plot_colors[k])
-            for checkpoint_t in checkpoint_time:
-                
-                if t <= checkpoint_t < t + self.accuracy:
-                    checkpoints.append(new_conentratinos.copy())
-            concentrations = new_conentratinos
-            t += self.accuracy
-        if plot == "interactive":
+                history_concentrations[0] = concentrations
+            # Checkpoint states are written into rows of one preallocated matrix
+            checkpoint_array = np.asarray(checkpoint_sorted, dtype=np.float64)
+            checkpoints_out = np.empty((len(checkpoint_array), len(concentrations)))
+            hits = self._advance(concentrations, 0, n_steps, mode, checkpoint_array, checkpoints_out,
+                                 history_concentrations)
+            checkpoints = checkpoints_out[:hits]
+            checkpoint_reached = self._step_end_times(checkpoint_array[:hits])
+            end_time = n_steps * self.accuracy
+        if plot :
             for k in range(len(self.concentrations)):
-                plt.plot([0 , 0],[0 , 0] , color = plot_colors[k], label = self.enviroment.compounds[k].unicode_formula)
+                plt.plot(history_t, history_concentrations[:, k], color = plot_colors[k], label = self.enviroment.compounds[k].unicode_formula)
+        if plot == "interactive":
             plt.legend()
             plt.show(block = False)
             
@@ -180,16 +1091,13 @@ class KineticalCalculator:
                 else:
                     print("Invalid input.")
         elif plot == "save" :
-            for k in range(len(self.concentrations)):
-                plt.plot([0 , 0],[0 , 0] , color = plot_colors[k], label = self.enviroment.compounds[k].unicode_formula)
             plt.legend()
             plt.savefig(directory)
             plt.close('all')
             del plt
-        checkpoints.append(concentrations)  
-        return checkpoints
+        return self._result(checkpoints, checkpoint_reached, end_time, concentrations, legacy_format)
 
-    def fit_calculate(self, enviroment, time, checkpoint_time=[], plot=False, directory="./plot.png", colors=None):
+    def fit_calculate(self, enviroment, time, checkpoint_time=[], plot=False, directory="./plot.png", colors=None, concentration_below_zero="SetToZero", legacy_format=True):
         """
         Fit the calculator to an environment and calculate reaction kinetics in one call.
         
@@ -227,12 +1135,17 @@ class KineticalCalculator:
             List of colors for plotting, one per compound.
             Each color can be a string (e.g., 'red', 'blue') or RGB tuple (e.g., (0.5, 0.3, 0.8)).
             If None, random colors are generated. Must have length equal to number of compounds.
+        concentration_below_zero : str, optional
+            What to do when a step would make a concentration negative:
+            "SetToZero" (default), "DoNotChange" or "GoNegetive".
+        legacy_format : bool, optional
+            If True (default), return a list of arrays; if False, return a `KineticResult`.
         
         Returns
         -------
-        list[list]
-            List of checkpoints, where each entry is `[time, concentrations]`.
-            The first entry includes the header `["time", compound_unicode_formulas]`.
+        list[numpy.ndarray] or KineticResult
+            The concentrations at each checkpoint reached followed by the final
+            concentrations, as returned by `calculate`.
         
         Raises
         ------
@@ -242,12 +1155,14 @@ class KineticalCalculator:
             If an invalid plotting mode or directory is provided.
         ValueError
             If `plot` is not one of [False, "save", "interactive"].
+        ValueError
+            If `concentration_below_zero` is not a valid option.
         
         Notes
         -----
         - This method automatically calls fit() before calculate(), so the
           environment does not need to be fitted beforehand
-        - Concentrations are clamped to zero if they become negative during simulation
+        - By default concentrations are clamped to zero if they become negative during simulation
         - Supports recording concentrations at arbitrary checkpoint times
         - Interactive plotting allows the user to type 'exit' to close the plot
         - The method uses numerical integration with a fixed time step defined by
@@ -262,9 +1177,9 @@ class KineticalCalculator:
         >>> results = kc.fit_calculate(env, time=10, checkpoint_time=[1, 5, 10], plot="interactive")
         """
         self.fit(enviroment)
-        return self.calculate(time, checkpoint_time, plot, directory, colors)
+        return self.calculate(time, checkpoint_time, plot, directory, colors, concentration_below_zero, legacy_format)
 
-    def calculate_responsively(self  , checkpoint_time = [] ,animation_update_interval = 0.1 , colors = None):
+    def calculate_responsively(self  , checkpoint_time = [] ,animation_update_interval = 0.1 , colors = None , concentration_below_zero = "SetToZero" , legacy_format = True):
         """
         Simulate and visualize reaction kinetics dynamically using an interactive animation.
 
@@ -275,9 +1190,14 @@ class KineticalCalculator:
         Args:
             checkpoint_time (list[float], optional): Specific times at which to record concentrations.
             animation_update_interval (float, optional): Time interval between animation updates (in seconds).
+                Each update advances the simulation by the same amount of simulated time.
             colors (list, optional): List of colors for plotting, one per compound.
                 Each color can be a string (e.g., 'red', 'blue') or RGB tuple (e.g., (0.5, 0.3, 0.8)).
                 If None, random colors are generated. Must have length equal to number of compounds.
+            concentration_below_zero (str, optional): What to do when a step would make a
+                concentration negative: "SetToZero" (default), "DoNotChange" or "GoNegetive".
+            legacy_format (bool, optional): If True (default), return a list of arrays;
+                if False, return a `KineticResult`.
             plot (bool, optional): Whether to visualize the reaction dynamically.
                 - If True, a live plot will be shown and user can interact with it:
                     * 'stop'  - pause the animation
@@ -286,17 +1206,19 @@ class KineticalCalculator:
                 - If False, no plot is generated.
 
         Returns:
-            list[list]: A list of checkpoint data of the form `[time, concentrations]`.
-                - Each entry is a snapshot of concentrations at the corresponding time.
-                - The last entry corresponds to the final concentrations at the end of the simulation.
+            list[numpy.ndarray] or KineticResult: The concentrations at each checkpoint reached,
+                followed by the final concentrations when the animation was closed, as for `calculate`.
 
         Raises:
             NameError: If the model has not been fitted to an environment (i.e., `fit` not called).
+            ValueError: If `method` is an adaptive method; the animation steps with a fixed step,
+                so only "euler" and "rk4" are supported.
+            ValueError: If `concentration_below_zero` is not a valid option.
 
         Notes:
-            - Negative concentrations are clamped to zero during simulation.
-            - The method relies on an internal `calculate_concentration_change` function
-            to compute instantaneous changes in concentrations per reaction step.
+            - Negative concentrations are handled according to `concentration_below_zero`.
+            - Each frame advances the simulation with `_advance`, the time-stepping core
+            shared with `calculate`.
             - This approach differs from `calculate()` by providing a live, responsive animation
             rather than a static plot or final checkpoint data.
             - Checkpoints specified in `checkpoint_time` are captured even during animation.
@@ -309,6 +1231,12 @@ class KineticalCalculator:
         plot = True
         if not self.fitted :
             raise NameError("You must fit the model to an Enviroment before calculation.")
+        if self.method in _SCIPY_METHODS:
+            raise ValueError(f"calculate_responsively requires method='euler' or 'rk4', not '{self.method}'.")
+        self._refit_if_changed()
+        mode = _BELOW_ZERO_MODES.get(concentration_below_zero)
+        if mode is None:
+            raise ValueError(f"`concentration_below_zero` is not one of {list(_BELOW_ZERO_MODES)}.")
         if plot :
              matplotlib.use("TkAgg", force=True)
         import matplotlib.pyplot as plt
@@ -316,7 +1244,6 @@ class KineticalCalculator:
 
         plt.figure()
         plot_colors = []
-        checkpoints = []
         if plot:
             num_compounds = len(self.enviroment.compounds)
             
@@ -334,51 +1261,50 @@ class KineticalCalculator:
             plt.ylabel("concentration")
                 
         
-        concentrations = self.enviroment.concentrations_array
-        rate_dependencies = self.enviroment.rate_dependency_array
-        stoichiometric_coefficient = self.enviroment.stoichiometric_coefficient_array
-        rate_constants = self.enviroment.rate_constants_array
-        time_interval = self.accuracy
-        eps = 1e-300
-        def calculate_rf():
-            log_c = np.log(concentrations + eps)
-            log_prod = rate_dependencies[:, 0, :] @ log_c
-            rf = np.exp(log_prod) * rate_constants[:, 0] * time_interval
-            return rf
-        def calculate_rb():
-            log_c = np.log(concentrations + eps)
-            log_prod = rate_dependencies[:, 1, :] @ log_c
-            rb = np.exp(log_prod) * rate_constants[:, 1] * time_interval
-            return rb
-        def calculate_concentration_change():
-            rate = -(calculate_rf() - calculate_rb())
-            concentration_change = stoichiometric_coefficient.T @ rate
-            return concentration_change.reshape(-1)
+        concentrations = self._C
+        concentrations[:] = self.enviroment.concentrations_array
         
-        time = count()
+        axes = plt.gca()
+        # One line per compound, updated in place and redrawn by blitting. The
+        # trajectory lives in an array that doubles in size when full; row 0 is
+        # the initial state and row `j + 1` the state after step `j`.
+        lines = [axes.plot([], [], color = plot_colors[k], label = self.enviroment.compounds[k].unicode_formula)[0]
+                 for k in range(len(self.concentrations))]
+        axes.set_xlim(0, 1)
+        axes.set_ylim(min(0, concentrations.min()), max(1, 1.1 * concentrations.max()))
+        # Each frame advances the simulation by `animation_update_interval`
+        steps_per_frame = max(1, int(animation_update_interval / self.accuracy))
+        history_concentrations = np.empty((max(1024, 2 * steps_per_frame), len(concentrations)))
+        history_concentrations[0] = concentrations
+        length = 1
+        checkpoint_array = np.asarray(sorted(checkpoint_t for checkpoint_t in checkpoint_time if checkpoint_t >= 0), dtype=np.float64)
+        checkpoints_out = np.empty((len(checkpoint_array), len(concentrations)))
+        hits = 0
         def animate(i):
             """Animation update loop for real-time kinetics visualization."""
 
-            nonlocal concentrations
-            t = self.accuracy * next(time)
-            
-            new_conentratinos = np.add(concentrations, calculate_concentration_change())
-            new_conentratinos[new_conentratinos < 0] = 0
-        
-            for k in range(len(self.concentrations)):
-                plt.plot([t , t-self.accuracy],[new_conentratinos[k] , concentrations[k]] , color = plot_colors[k])
-                
-            for checkpoint_t in checkpoint_time:
-                
-                if t <= checkpoint_t < t + self.accuracy:
-                    checkpoints.append(new_conentratinos.copy())
-            concentrations = new_conentratinos
+            nonlocal hits, length, history_concentrations
+            while length + steps_per_frame > len(history_concentrations):
+                history_concentrations = np.concatenate([history_concentrations, np.empty_like(history_concentrations)])
+            hits += self._advance(concentrations, length - 1, steps_per_frame, mode, checkpoint_array[hits:],
+                                  checkpoints_out[hits:], history_concentrations[length - 1:length + steps_per_frame])
+            length += steps_per_frame
+            history_t = np.arange(length) * self.accuracy
+            for k, line in enumerate(lines):
+                line.set_data(history_t, history_concentrations[:length, k])
+            # Blitting only redraws the lines, so the axes are rescaled (and the
+            # figure fully redrawn) only when the data leaves the current limits
+            t = history_t[-1]
+            lower, upper = axes.get_ylim()
+            if t > axes.get_xlim()[1] or concentrations.min() < lower or concentrations.max() > upper:
+                axes.set_xlim(0, max(axes.get_xlim()[1], 2 * t))
+                axes.set_ylim(min(lower, 2 * concentrations.min()), max(upper, 2 * concentrations.max()))
+                plt.gcf().canvas.draw_idle()
+            return lines
 
-        ani = FuncAnimation(plt.gcf() , animate , interval = animation_update_interval , cache_frame_data=False)        
+        ani = FuncAnimation(plt.gcf() , animate , init_func = lambda: lines , interval = 1000 * animation_update_interval ,
+                            blit = True , cache_frame_data=False)
         if plot :
-            for k in range(len(self.concentrations)):
-                plt.plot([0 , 0],[0 , 0] , color = plot_colors[k], label = self.enviroment.compounds[k].unicode_formula)
-
             plt.legend()
             plt.show(block = False)
             print("Type 'exit' to close / 'stop' to pause / 'resume' to continue:")
@@ -395,5 +1321,5 @@ class KineticalCalculator:
                 else:
                     print("invalid_input")       
                     
-        checkpoints.append(concentrations)  
-        return checkpoints
\ No newline at end of file
+        return self._result(checkpoints_out[:hits], self._step_end_times(checkpoint_array[:hits]),
+                            (length - 1) * self.accuracy, concentrations, legacy_format)
\ No newline at end of file
@@ -0,0 +1,124 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled Euler/RK4 kernel for `KineticalCalculator`.
+
+This mirrors `_rhs`, `_step` and `_integrate` in `Kinetic.py` and is used when
+numba is not installed. The extension is optional; it is built only when Cython
+and a C compiler are available.
+"""
+from libc.math cimport pow
+
+
+cdef void _rhs(const double[::1] concentrations, double[::1] concentration_change,
+               const int[:, ::1] reactant_idx, const int[:, ::1] product_idx,
+               const int[::1] n_r, const int[::1] n_p,
+               const double[:, ::1] stoich_r, const double[:, ::1] stoich_p,
+               const double[:, ::1] dep_r, const double[:, ::1] dep_p,
+               const double[::1] kf, const double[::1] kb, double time_interval) noexcept nogil:
+    cdef Py_ssize_t rxn, j, k
+    cdef double rf, rb, c, d
+    for k in range(concentration_change.shape[0]):
+        concentration_change[k] = 0.0
+    for rxn in range(kf.shape[0]):
+        rf = time_interval * kf[rxn]
+        for j in range(n_r[rxn] if rf != 0.0 else 0):
+            c = concentrations[reactant_idx[rxn, j]]
+            d = dep_r[rxn, j]
+            if d == 1.0:
+                rf *= c
+            elif d == 2.0:
+                rf *= c * c
+            elif c == 0.0 and d < 0:
+                rf = 0.0
+                break
+            else:
+                rf *= pow(c, d)
+        rb = time_interval * kb[rxn]
+        for j in range(n_p[rxn] if rb != 0.0 else 0):
+            c = concentrations[product_idx[rxn, j]]
+            d = dep_p[rxn, j]
+            if d == 1.0:
+                rb *= c
+            elif d == 2.0:
+                rb *= c * c
+            elif c == 0.0 and d < 0:
+                rb = 0.0
+                break
+            else:
+                rb *= pow(c, d)
+        for j in range(n_r[rxn]):
+            concentration_change[reactant_idx[rxn, j]] += (rb - rf) * stoich_r[rxn, j]
+        for j in range(n_p[rxn]):
+            concentration_change[product_idx[rxn, j]] += (rf - rb) * stoich_p[rxn, j]
+
+
+cdef inline double _updated(double value, double change, int mode) noexcept nogil:
+    cdef double new_value = value + change
+    if mode == 0:
+        return 0.0 if new_value <= 0 else new_value
+    if mode == 1:
+        return value if new_value <= 0 else new_value
+    return new_value
+
+
+cdef inline double _stage_value(double value, int mode) noexcept nogil:
+    return value if mode == 2 or value > 0 else 0.0
+
+
+cdef void _step(double[::1] concentrations, double[:, ::1] work,
+                const int[:, ::1] reactant_idx, const int[:, ::1] product_idx,
+                const int[::1] n_r, const int[::1] n_p,
+                const double[:, ::1] stoich_r, const double[:, ::1] stoich_p,
+                const double[:, ::1] dep_r, const double[:, ::1] dep_p,
+                const double[::1] kf, const double[::1] kb, double time_interval, bint rk4,
+                int mode) noexcept nogil:
+    cdef Py_ssize_t k, s
+    cdef double weight
+    if not rk4:
+        _rhs(concentrations, work[0], reactant_idx, product_idx, n_r, n_p,
+             stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval)
+        for k in range(concentrations.shape[0]):
+            concentrations[k] = _updated(concentrations[k], work[0, k], mode)
+    else:
+        _rhs(concentrations, work[0], reactant_idx, product_idx, n_r, n_p,
+             stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval)
+        for s in range(1, 4):
+            weight = 1.0 if s == 3 else 0.5
+            for k in range(concentrations.shape[0]):
+                work[4, k] = _stage_value(concentrations[k] + weight * work[s - 1, k], mode)
+            _rhs(work[4], work[s], reactant_idx, product_idx, n_r, n_p,
+                 stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval)
+        for k in range(concentrations.shape[0]):
+            concentrations[k] = _updated(concentrations[k],
+                                         (work[0, k] + 2 * work[1, k] + 2 * work[2, k] + work[3, k]) / 6, mode)
+
+
+def integrate(double[::1] concentrations, double[:, ::1] work,
+              const int[:, ::1] reactant_idx, const int[:, ::1] product_idx,
+              const int[::1] n_r, const int[::1] n_p,
+              const double[:, ::1] stoich_r, const double[:, ::1] stoich_p,
+              const double[:, ::1] dep_r, const double[:, ::1] dep_p,
+              const double[::1] kf, const double[::1] kb, double time_interval, bint rk4, int mode,
+              Py_ssize_t first_step, Py_ssize_t n_steps, const double[::1] checkpoint_times,
+              double[:, ::1] checkpoints_out, double[:, ::1] history_out):
+    """
+    Run `n_steps` steps, recording checkpoints and history exactly like `Kinetic._integrate`.
+
+    Returns:
+        int: Number of rows written to `checkpoints_out`.
+    """
+    cdef Py_ssize_t i, k
+    cdef Py_ssize_t hits = 0
+    cdef Py_ssize_t n_checkpoints = checkpoint_times.shape[0]
+    cdef double t
+    with nogil:
+        for i in range(n_steps):
+            t = (first_step + i) * time_interval
+            _step(concentrations, work, reactant_idx, product_idx, n_r, n_p,
+                  stoich_r, stoich_p, dep_r, dep_p, kf, kb, time_interval, rk4, mode)
+            if history_out.shape[0] > 0:
+                history_out[i + 1, :] = concentrations
+            while hits < n_checkpoints and checkpoint_times[hits] < t + time_interval:
+                checkpoints_out[hits, :] = concentrations
+                hits += 1
+    return hits
@@ -34,6 +34,26 @@ def test_kinetical_calculator_init_small_accuracy():
     assert kc.fitted == False
 
 
+def test_kinetical_calculator_init_method():
+    """Test initialization with an adaptive integration method."""
+    kc = KineticalCalculator(method="LSODA", rtol=1e-8)
+    assert kc.method == "LSODA"
+    assert kc.rtol == 1e-8
+
+
+def test_kinetical_calculator_init_rk4_default_accuracy():
+    """Test that RK4 defaults to a larger time step than Euler."""
+    kc = KineticalCalculator(method="rk4")
+    assert kc.accuracy == 1e-1
+    assert KineticalCalculator(accuracy=0.05, method="rk4").accuracy == 0.05
+
+
+def test_kinetical_calculator_init_invalid_method():
+    """Test that an unknown integration method raises ValueError."""
+    with pytest.raises(ValueError, match="`method` is not one of"):
+        KineticalCalculator(method="midpoint")
+
+
 # ---------- Fixture for test environment ---------- #
 
 @pytest.fixture
@@ -132,6 +152,46 @@ def test_fit_multi_reaction_environment(multi_reaction_environment):
     assert kc.rate_constants[1] == [0.3, 0.2]
 
 
+def test_calculate_follows_temperature_change_after_fit():
+    """Test that changing the environment's temperature after fit changes the result."""
+    A = Compound("A")
+    B = Compound("B")
+    rxn = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 1}],
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [1.0], [0.0], K=2.0, kf=0.5, kb=0.25, enthalpy=-50000, entropy=-100,
+        activation_energy_forward=50000, activation_energy_backward=100000, T=298
+    )
+    env = Enviroment(rxn, T=298)
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(env)
+    cold = kc.calculate(time=1.0)[-1]
+    env.T = 400
+    hot = kc.calculate(time=1.0)[-1]
+
+    assert kc.rate_constants == env.rate_constants
+    assert not np.allclose(cold, hot)
+    kc.fit(env)
+    assert np.allclose(hot, kc.calculate(time=1.0)[-1])
+
+
+def test_calculate_follows_reaction_added_after_fit(simple_environment):
+    """Test that a reaction added after fit is included in the next calculation."""
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(simple_environment)
+    kc.calculate(time=1.0)
+    C = Compound("C")
+    simple_environment.add(Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": simple_environment.compounds[1], "rate_dependency": 1}],
+        [{"stoichiometric_coefficient": 1, "compound": C, "rate_dependency": 1}],
+        [0.0], [0.0], K=1.5, kf=0.3, kb=0.2
+    ))
+    results = kc.calculate(time=1.0)
+
+    assert kc.number_of_reactions == 2
+    assert np.allclose(results[-1], KineticalCalculator(accuracy=0.01).fit_calculate(simple_environment, time=1.0)[-1])
+
+
 def test_fit_overwrites_previous_environment(simple_environment, multi_reaction_environment):
     """Test that fitting again overwrites the previous environment."""
     kc = KineticalCalculator()
@@ -237,6 +297,21 @@ def test_calculate_save_plot(simple_environment, tmp_path):
     # Note: This test may fail if matplotlib backend doesn't support file saving in test environment
 
 
+def test_calculate_plot_times_match_result_times(simple_environment, tmp_path):
+    """Test that the plotted trajectory starts at t = 0 and ends at the result's end time."""
+    import matplotlib.pyplot as plt
+
+    kc = KineticalCalculator(method="rk4")
+    kc.fit(simple_environment)
+    with patch("matplotlib.pyplot.plot", wraps=plt.plot) as plot:
+        result = kc.calculate(time=1.95, plot="save", directory=str(tmp_path / "plot.png"), legacy_format=False)
+
+    times, values = plot.call_args_list[0].args[:2]
+    assert times[0] == 0.0 and values[0] == 1.0
+    assert np.isclose(times[-1], result.times[-1])
+    assert np.isclose(values[-1], result.C[-1, 0])
+
+
 @patch('builtins.input', return_value='exit')
 def test_calculate_interactive_plot(mock_input, simple_environment):
     """Test calculate with plot="interactive" mode (mocked input)."""
@@ -364,6 +439,14 @@ def test_calculate_responsively_fitted(simple_environment):
     # interactive and animation-dependent nature
 
 
+def test_calculate_responsively_rejects_adaptive_methods(simple_environment):
+    """Test that calculate_responsively refuses adaptive methods instead of silently stepping with Euler."""
+    kc = KineticalCalculator(method="LSODA")
+    kc.fit(simple_environment)
+    with pytest.raises(ValueError, match="requires method='euler' or 'rk4'"):
+        kc.calculate_responsively()
+
+
 # ---------- Edge Cases and Integration Tests ---------- #
 
 def test_zero_time_calculation(simple_environment):
@@ -460,3 +543,621 @@ def test_reaction_with_zero_rate_constants():
     initial = env.concentrations_array
     final = results[-1]
     assert np.allclose(final, initial, atol=1e-6)
+
+
+def test_concentration_change_matches_dense_rate_law():
+    """Test that the padded per-reaction arrays reproduce the dense mass-action rate law."""
+    A = Compound("A")
+    B = Compound("B")
+    C = Compound("C")
+    D = Compound("D")
+    rxn1 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 1},
+         {"stoichiometric_coefficient": 2, "compound": B, "rate_dependency": 2}],
+        [{"stoichiometric_coefficient": 1, "compound": C, "rate_dependency": 1}],
+        [1.0, 0.8], [0.2], K=2.0, kf=0.7, kb=0.1
+    )
+    rxn2 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": C, "rate_dependency": 0.5}],
+        [{"stoichiometric_coefficient": 2, "compound": D, "rate_dependency": 1}],
+        [0.0], [0.3], K=2.0, kf=0.3, kb=0.05
+    )
+    env = Enviroment(rxn1, rxn2, T=298)
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(env)
+
+    concentrations = env.concentrations_array.astype(float)
+    dependencies = env.rate_dependency_array
+    rate_constants = env.rate_constants_array
+    rf = rate_constants[:, 0] * np.prod(concentrations ** dependencies[:, 0, :], axis=1)
+    rb = rate_constants[:, 1] * np.prod(concentrations ** dependencies[:, 1, :], axis=1)
+    expected = env.stoichiometric_coefficient_array.T @ (rb - rf) * 0.01
+
+    assert np.allclose(kc._concentration_change(concentrations, 0.01, np.empty(4)), expected)
+
+
+def test_irreversible_reactions_skip_zero_rate_sides():
+    """Test that sides with a zero rate constant are left out without changing the rate law."""
+    A = Compound("A")
+    B = Compound("B")
+    C = Compound("C")
+    rxn1 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 1}],
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1.5}],
+        [1.0], [0.2], K=1.0, kf=0.7, kb=0.0
+    )
+    rxn2 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [{"stoichiometric_coefficient": 2, "compound": C, "rate_dependency": 1}],
+        [0.2], [0.1], K=2.0, kf=0.3, kb=0.05
+    )
+    env = Enviroment(rxn1, rxn2, T=298)
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(env)
+    assert kc._forward[0] is None
+    assert list(kc._backward[0]) == [1]
+
+    concentrations = env.concentrations_array.astype(float)
+    dependencies = env.rate_dependency_array
+    rate_constants = env.rate_constants_array
+    rf = rate_constants[:, 0] * np.prod(concentrations ** dependencies[:, 0, :], axis=1)
+    rb = rate_constants[:, 1] * np.prod(concentrations ** dependencies[:, 1, :], axis=1)
+    expected = env.stoichiometric_coefficient_array.T @ (rb - rf) * 0.01
+
+    assert np.allclose(kc._concentration_change(concentrations, 0.01, np.empty(3)), expected)
+
+
+def test_negative_rate_dependency_with_zero_concentration():
+    """Test that a zero concentration with a negative rate dependency stops the reaction."""
+    A = Compound("A")
+    B = Compound("B")
+    rxn = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": -1}],
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [0.0], [1.0], K=1.0, kf=0.5, kb=0.0
+    )
+    env = Enviroment(rxn, T=298)
+    kc = KineticalCalculator(accuracy=0.1)
+    kc.fit(env)
+    results = kc.calculate(time=1.0, plot=False)
+
+    assert np.all(np.isfinite(results[-1]))
+    assert np.allclose(results[-1], [0.0, 1.0])
+
+
+def test_compiled_step_matches_numpy_step(multi_reaction_environment):
+    """Test that the numba-compiled Euler step agrees with the NumPy implementation."""
+    pytest.importorskip("numba")
+    from ChemCompute.Kinetic import _step
+
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(multi_reaction_environment)
+    concentrations = np.array([0.6, 0.3, 0.1])
+    expected = np.maximum(concentrations + kc._concentration_change(concentrations, 0.01, np.empty(3)), 0)
+
+    _step(concentrations, np.empty((5, 3)), *kc._network, 0.01, False, 0, None, None)
+
+    assert np.allclose(concentrations, expected)
+
+
+def test_parallel_rhs_matches_serial_rhs(multi_reaction_environment):
+    """Test that the thread-parallel rate evaluation gives the serial rate law's result."""
+    pytest.importorskip("numba")
+    from ChemCompute.Kinetic import _rhs, _rhs_parallel
+
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(multi_reaction_environment)
+    concentrations = np.array([0.6, 0.3, 0.1])
+    serial = np.empty(3)
+    parallel = np.empty(3)
+
+    _rhs(concentrations, serial, *kc._network, 0.01)
+    _rhs_parallel(concentrations, parallel, *kc._network, 0.01)
+
+    assert np.allclose(serial, parallel)
+
+
+def test_parallel_step_matches_serial_step(multi_reaction_environment):
+    """Test that a step run with the thread-parallel rate evaluation matches the serial step."""
+    pytest.importorskip("numba")
+    from ChemCompute.Kinetic import _step
+
+    kc = KineticalCalculator(method="rk4")
+    kc.fit(multi_reaction_environment)
+    serial = np.array([0.6, 0.3, 0.1])
+    parallel = serial.copy()
+
+    _step(serial, np.empty((5, 3)), *kc._network, kc.accuracy, True, 0, None, None)
+    _step(parallel, np.empty((5, 3)), *kc._network, kc.accuracy, True, 0, None, True)
+
+    assert np.allclose(serial, parallel)
+
+
+@pytest.mark.parametrize("method", ["LSODA", "BDF", "RK45"])
+def test_solve_ivp_methods_match_analytic_solution(simple_environment, method):
+    """Test adaptive methods against the analytic solution of A ⇌ B."""
+    pytest.importorskip("scipy")
+    kc = KineticalCalculator(method=method, rtol=1e-8, atol=1e-10)
+    kc.fit(simple_environment)
+    results = kc.calculate(time=2.0, checkpoint_time=[0.5, 1.0], plot=False)
+
+    # A(t) = A_eq + (A_0 - A_eq) * exp(-(kf + kb) * t) with kf = 0.5, kb = 0.25
+    def analytic_A(t):
+        return 1 / 3 + (2 / 3) * np.exp(-0.75 * t)
+
+    assert len(results) == 3
+    for checkpoint, t in zip(results, [0.5, 1.0, 2.0]):
+        assert np.allclose(checkpoint, [analytic_A(t), 1 - analytic_A(t)], atol=1e-6)
+
+
+@pytest.mark.parametrize("method", ["LSODA", "BDF"])
+def test_solve_ivp_go_negative_does_not_clamp_rates(method):
+    """Test that "GoNegetive" integrates the unclamped rate equations with adaptive methods."""
+    pytest.importorskip("scipy")
+    A = Compound("A")
+    B = Compound("B")
+    rxn = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 1}],
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [-0.2], [1.2], K=2.0, kf=0.5, kb=0.25
+    )
+    kc = KineticalCalculator(method=method, rtol=1e-8, atol=1e-10)
+    kc.fit(Enviroment(rxn, T=298))
+    results = kc.calculate(time=0.5, concentration_below_zero="GoNegetive")
+
+    expected_A = 1 / 3 + (-0.2 - 1 / 3) * np.exp(-0.75 * 0.5)
+    assert np.allclose(results[-1], [expected_A, 1 - expected_A], atol=1e-6)
+    assert kc.calculate(time=0.5)[-1][0] == 0
+
+
+def test_jacobian_matches_finite_differences(multi_reaction_environment):
+    """Test the analytic sparse Jacobian against a finite-difference estimate."""
+    pytest.importorskip("scipy")
+    kc = KineticalCalculator()
+    kc.fit(multi_reaction_environment)
+    concentrations = np.array([0.6, 0.3, 0.1])
+
+    jacobian = kc.jacobian(0.0, concentrations)
+    eps = 1e-7
+    expected = np.zeros((3, 3))
+    for m in range(3):
+        shifted = concentrations.copy()
+        shifted[m] += eps
+        expected[:, m] = (kc._rate(0.0, shifted) - kc._rate(0.0, concentrations)) / eps
+
+    assert jacobian.shape == (3, 3)
+    assert np.allclose(jacobian.toarray(), expected, atol=1e-6)
+
+
+def test_jacobian_not_fitted():
+    """Test that jacobian raises NameError when not fitted."""
+    kc = KineticalCalculator()
+    with pytest.raises(NameError):
+        kc.jacobian(0.0, np.array([1.0]))
+
+
+def test_rk4_matches_analytic_solution(simple_environment):
+    """Test that RK4 with a large step stays close to the analytic solution of A ⇌ B."""
+    kc = KineticalCalculator(method="rk4")
+    kc.fit(simple_environment)
+    results = kc.calculate(time=1.95, plot=False)
+
+    # 20 steps of 0.1 end at t = 2.0
+    expected_A = 1 / 3 + (2 / 3) * np.exp(-0.75 * 2.0)
+    assert np.allclose(results[-1], [expected_A, 1 - expected_A], atol=1e-5)
+
+
+@pytest.mark.parametrize("kernel", ["numba", "unrolled", "cython", "numpy"])
+def test_rk4_fractional_order_keeps_mass(monkeypatch, kernel):
+    """Test that RK4 stages that overshoot below zero do not turn a fractional-order rate into NaN."""
+    from ChemCompute import Kinetic
+
+    if kernel in ("numba", "unrolled"):
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(Kinetic, "numba", None)
+    if kernel == "unrolled":
+        monkeypatch.setattr(Kinetic, "_UNROLL_MIN_WORK", 0)
+    if kernel == "cython":
+        pytest.importorskip("ChemCompute._kinetic_step")
+    if kernel == "numpy":
+        monkeypatch.setattr(Kinetic, "_kinetic_step", None)
+    A = Compound("A")
+    B = Compound("B")
+    rxn = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 0.5}],
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [1.0], [0.0], K=1.0, kf=10, kb=0
+    )
+    kc = KineticalCalculator(method="rk4")
+    kc.fit(Enviroment(rxn, T=298))
+    results = kc.calculate(time=2.0)
+
+    assert np.all(np.isfinite(results[-1]))
+    assert np.allclose(results[-1], [0.0, 1.0], atol=1e-2)
+
+
+def test_compiled_rk4_step_matches_numpy_step(multi_reaction_environment):
+    """Test that the numba-compiled RK4 step agrees with the NumPy implementation."""
+    pytest.importorskip("numba")
+    from ChemCompute.Kinetic import _step
+
+    kc = KineticalCalculator(method="rk4")
+    kc.fit(multi_reaction_environment)
+    concentrations = np.array([0.6, 0.3, 0.1])
+    expected = np.maximum(concentrations + kc._increment(concentrations), 0)
+
+    _step(concentrations, np.empty((5, 3)), *kc._network, kc.accuracy, True, 0, None, None)
+
+    assert np.allclose(concentrations, expected)
+
+
+@pytest.mark.parametrize("method", ["euler", "rk4"])
+def test_numpy_integration_matches_compiled_integration(multi_reaction_environment, monkeypatch, method):
+    """Test that the NumPy fallback loop and the compiled loop give the same checkpoints."""
+    pytest.importorskip("numba")
+    from ChemCompute import Kinetic
+
+    kc = KineticalCalculator(method=method)
+    kc.fit(multi_reaction_environment)
+    compiled = kc.calculate(time=1.0, checkpoint_time=[0.3, 0.6], plot=False)
+    monkeypatch.setattr(Kinetic, "numba", None)
+    fallback = kc.calculate(time=1.0, checkpoint_time=[0.3, 0.6], plot=False)
+
+    assert len(compiled) == len(fallback) == 3
+    for a, b in zip(compiled, fallback):
+        assert np.allclose(a, b)
+
+
+def test_integer_orders_use_repeated_products(multi_reaction_environment):
+    """Test that integer rate dependencies are evaluated without pow and give the same rates."""
+    kc = KineticalCalculator()
+    kc.fit(multi_reaction_environment)
+    concentrations = np.array([0.6, 0.3, 0.1])
+
+    assert kc._repeated_r is not None
+    assert kc._repeated_p is not None
+    for _, args in (kc._forward, kc._backward):
+        assert np.allclose(KineticalCalculator._side_rate(concentrations, *args),
+                           KineticalCalculator._side_rate(concentrations, *args[:4]))
+
+
+def test_fractional_orders_use_pow():
+    """Test that fractional rate dependencies fall back to the general power evaluation."""
+    A = Compound("A")
+    B = Compound("B")
+    rxn = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 0.5}],
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [1.0], [0.0], K=1.0, kf=0.5, kb=0.1
+    )
+    kc = KineticalCalculator()
+    kc.fit(Enviroment(rxn, T=298))
+
+    assert kc._repeated_r is None
+    assert kc._repeated_p is not None
+
+
+def test_mixed_orders_use_pow_only_where_needed():
+    """Test that one fractional order keeps repeated products for the other reactions."""
+    from ChemCompute.Kinetic import _repeat_by_order
+
+    repeated_index, repeated_mask, integer = _repeat_by_order([[0], [1]], [[0.5], [2]])
+    assert list(integer) == [False, True]
+    assert not repeated_mask[0].any()
+    assert list(repeated_index[1][repeated_mask[1]]) == [1, 1]
+
+    A = Compound("A")
+    B = Compound("B")
+    C = Compound("C")
+    rxn1 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 0.5}],
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [1.0], [0.0], K=1.0, kf=0.5, kb=0.1
+    )
+    rxn2 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 2}],
+        [{"stoichiometric_coefficient": 1, "compound": C, "rate_dependency": 1}],
+        [0.0], [0.0], K=1.0, kf=0.3, kb=0.2
+    )
+    kc = KineticalCalculator()
+    kc.fit(Enviroment(rxn1, rxn2, T=298))
+    concentrations = np.array([0.6, 0.3, 0.1])
+
+    assert kc._repeated_r is not None
+    _, args = kc._forward
+    assert np.allclose(KineticalCalculator._side_rate(concentrations, *args),
+                       KineticalCalculator._side_rate(concentrations, *args[:4]))
+
+
+def test_unsorted_checkpoints_are_recorded_in_time_order(simple_environment):
+    """Test that checkpoints are returned in time order whatever order they are given in."""
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(simple_environment)
+    results = kc.calculate(time=1.0, checkpoint_time=[0.8, -0.5, 0.2, 0.5], plot=False)
+
+    assert len(results) == 4
+    A = [checkpoint[0] for checkpoint in results]
+    assert A[0] > A[1] > A[2] > A[3]
+    expected_A = 1 / 3 + (2 / 3) * np.exp(-0.75 * np.array([0.2, 0.5, 0.8]))
+    assert np.allclose(A[:3], expected_A, atol=5e-3)
+
+
+@pytest.mark.parametrize("mode, expected", [
+    ("SetToZero", [0.0, 1.5]),
+    ("DoNotChange", [1.0, 1.5]),
+    ("GoNegetive", [-0.5, 1.5]),
+])
+def test_concentration_below_zero_modes(simple_environment, mode, expected):
+    """Test each policy for a step that overshoots below zero (one step of 3.0)."""
+    kc = KineticalCalculator(accuracy=3.0)
+    kc.fit(simple_environment)
+    results = kc.calculate(time=0.0, plot=False, concentration_below_zero=mode)
+
+    assert np.allclose(results[-1], expected)
+
+
+@pytest.mark.parametrize("mode", ["SetToZero", "DoNotChange", "GoNegetive"])
+def test_concentration_below_zero_modes_in_compiled_kernel(simple_environment, monkeypatch, mode):
+    """Test that the compiled kernel applies each policy like the NumPy loop."""
+    pytest.importorskip("numba")
+    from ChemCompute import Kinetic
+
+    kc = KineticalCalculator(accuracy=3.0)
+    kc.fit(simple_environment)
+    compiled = kc.calculate(time=6.0, checkpoint_time=[3.0], plot=False, concentration_below_zero=mode)
+    monkeypatch.setattr(Kinetic, "numba", None)
+    monkeypatch.setattr(Kinetic, "_kinetic_step", None)
+    fallback = kc.calculate(time=6.0, checkpoint_time=[3.0], plot=False, concentration_below_zero=mode)
+
+    assert len(compiled) == len(fallback) == 2
+    for a, b in zip(compiled, fallback):
+        assert np.allclose(a, b)
+
+
+@pytest.mark.parametrize("kernel", ["numba", "cython", "numpy"])
+@pytest.mark.parametrize("mode", [0, 1, 2])
+def test_nan_passes_through_every_kernel(simple_environment, monkeypatch, kernel, mode):
+    """Test that every kernel propagates a NaN state instead of clamping it away."""
+    from ChemCompute import Kinetic
+
+    if kernel == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(Kinetic, "numba", None)
+    if kernel == "cython":
+        pytest.importorskip("ChemCompute._kinetic_step")
+    if kernel == "numpy":
+        monkeypatch.setattr(Kinetic, "_kinetic_step", None)
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(simple_environment)
+    concentrations = np.array([np.nan, 0.5])
+    kc._advance(concentrations, 0, 1, mode, np.empty(0), np.empty((0, 2)), np.empty((0, 2)))
+
+    assert np.isnan(concentrations).all()
+
+
+def test_concentration_below_zero_invalid(simple_environment):
+    """Test that an unknown concentration_below_zero policy raises ValueError."""
+    kc = KineticalCalculator()
+    kc.fit(simple_environment)
+    with pytest.raises(ValueError, match="`concentration_below_zero` is not one of"):
+        kc.calculate(time=1.0, concentration_below_zero="Clamp")
+
+
+@pytest.mark.parametrize("method", ["euler", "rk4"])
+def test_cython_integration_matches_numpy_integration(multi_reaction_environment, monkeypatch, method):
+    """Test that the optional Cython kernel gives the same checkpoints as the NumPy loop."""
+    pytest.importorskip("ChemCompute._kinetic_step")
+    from ChemCompute import Kinetic
+
+    monkeypatch.setattr(Kinetic, "numba", None)
+    kc = KineticalCalculator(method=method)
+    kc.fit(multi_reaction_environment)
+    compiled = kc.calculate(time=1.0, checkpoint_time=[0.3, 0.6], plot=False)
+    monkeypatch.setattr(Kinetic, "_kinetic_step", None)
+    fallback = kc.calculate(time=1.0, checkpoint_time=[0.3, 0.6], plot=False)
+
+    assert len(compiled) == len(fallback) == 3
+    for a, b in zip(compiled, fallback):
+        assert np.allclose(a, b)
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_advance_in_chunks_matches_single_run(multi_reaction_environment, monkeypatch, compiled):
+    """Test that advancing frame by frame, as the animation does, gives the same states as one run."""
+    from ChemCompute import Kinetic
+
+    if compiled:
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(Kinetic, "numba", None)
+        monkeypatch.setattr(Kinetic, "_kinetic_step", None)
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(multi_reaction_environment)
+    checkpoint_times = np.array([0.25, 0.5, 0.55])
+
+    whole = kc.enviroment.concentrations_array.astype(float)
+    whole_out = np.empty((3, 3))
+    assert kc._advance(whole, 0, 100, 0, checkpoint_times, whole_out, np.empty((0, 3))) == 3
+
+    chunked = kc.enviroment.concentrations_array.astype(float)
+    chunked_out = np.empty((3, 3))
+    hits = 0
+    for first_step in range(0, 100, 30):
+        n_steps = min(30, 100 - first_step)
+        hits += kc._advance(chunked, first_step, n_steps, 0, checkpoint_times[hits:], chunked_out[hits:],
+                            np.empty((0, 3)))
+
+    assert hits == 3
+    assert np.allclose(whole_out, chunked_out)
+    assert np.allclose(whole, chunked)
+
+
+@pytest.mark.parametrize("rk4", [False, True])
+def test_unrolled_kernel_matches_general_kernel(rk4):
+    """Test that the kernel generated for a small network matches the general compiled kernel."""
+    pytest.importorskip("numba")
+    from ChemCompute.Kinetic import _integrate, _unrolled_integrate
+
+    A = Compound("A")
+    B = Compound("B")
+    C = Compound("C")
+    D = Compound("D")
+    rxn1 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 1},
+         {"stoichiometric_coefficient": 2, "compound": B, "rate_dependency": 2}],
+        [{"stoichiometric_coefficient": 1, "compound": C, "rate_dependency": 1}],
+        [1.0, 0.8], [0.0], K=2.0, kf=0.7, kb=0.1
+    )
+    rxn2 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": C, "rate_dependency": 0.5}],
+        [{"stoichiometric_coefficient": 2, "compound": D, "rate_dependency": 1}],
+        [0.0], [0.0], K=2.0, kf=0.3, kb=0.05
+    )
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(Enviroment(rxn1, rxn2, T=298))
+    assert kc._structure is not None
+
+    checkpoint_times = np.array([0.5, 1.0])
+    results = []
+    for integrate, network, extra in [(_integrate, kc._network, (None, None)),
+                                      (_unrolled_integrate(kc._structure), (kc._kf, kc._kb), ())]:
+        concentrations = kc.enviroment.concentrations_array.astype(float)
+        checkpoints_out = np.empty((2, 4))
+        hits = integrate(concentrations, np.empty((5, 4)), *network, 0.01, rk4, 0, 0, 200,
+                         checkpoint_times, checkpoints_out, np.empty((0, 4)), *extra)
+        results.append((hits, checkpoints_out, concentrations))
+
+    assert results[0][0] == results[1][0] == 2
+    assert np.allclose(results[0][1], results[1][1])
+    assert np.allclose(results[0][2], results[1][2])
+
+
+def test_unrolled_kernel_accepts_numpy_scalars(monkeypatch):
+    """Test that NumPy scalar coefficients and orders can be written into the generated kernel."""
+    pytest.importorskip("numba")
+    from ChemCompute import Kinetic
+
+    A = Compound("A")
+    B = Compound("B")
+    rxn = Reaction(
+        [{"stoichiometric_coefficient": np.float64(1.0), "compound": A, "rate_dependency": np.int64(1)}],
+        [{"stoichiometric_coefficient": np.float64(1.0), "compound": B, "rate_dependency": np.float64(1.0)}],
+        [1.0], [0.0], K=2.0, kf=0.5, kb=0.25
+    )
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(Enviroment(rxn, T=298))
+    expected = kc.calculate(time=1.0)
+    monkeypatch.setattr(Kinetic, "_UNROLL_MIN_WORK", 0)
+
+    assert all(type(value) in (int, float) for side in kc._structure[1][0][:2] for entry in side for value in entry)
+    assert np.allclose(kc.calculate(time=1.0), expected)
+
+
+def test_julia_backend_requires_adaptive_method():
+    """Test that the Julia backend rejects fixed-step methods and unknown backends."""
+    with pytest.raises(ValueError, match="requires an adaptive method"):
+        KineticalCalculator(method="euler", backend="julia")
+    with pytest.raises(ValueError, match="`backend` is not one of"):
+        KineticalCalculator(method="BDF", backend="fortran")
+
+
+def test_julia_backend_without_diffeqpy(simple_environment):
+    """Test that the Julia backend reports a missing diffeqpy installation."""
+    try:
+        import diffeqpy  # noqa: F401
+        pytest.skip("diffeqpy is installed")
+    except ImportError:
+        pass
+    kc = KineticalCalculator(method="BDF", backend="julia")
+    kc.fit(simple_environment)
+    with pytest.raises(ImportError, match="diffeqpy"):
+        kc.calculate(time=1.0)
+
+
+def test_calculate_returns_kinetic_result(simple_environment):
+    """Test the array result returned with legacy_format=False."""
+    from ChemCompute.Kinetic import KineticResult
+
+    kc = KineticalCalculator(accuracy=0.01)
+    kc.fit(simple_environment)
+    legacy = kc.calculate(time=2.0, checkpoint_time=[1.5, 0.5, 5.0], plot=False)
+    result = kc.calculate(time=2.0, checkpoint_time=[1.5, 0.5, 5.0], plot=False, legacy_format=False)
+
+    assert isinstance(result, KineticResult)
+    # Each state is labelled with the end of the step that recorded it
+    assert np.allclose(result.times, [0.51, 1.51, 2.01])
+    assert result.C.shape == (3, 2)
+    assert np.allclose(result.C, np.array(legacy))
+    assert result.names == [compound.unicode_formula for compound in simple_environment.compounds]
+
+
+def test_kinetic_result_times_match_rk4_states(simple_environment):
+    """Test that the fixed-step result times are the times its states belong to."""
+    kc = KineticalCalculator(method="rk4")
+    kc.fit(simple_environment)
+    result = kc.calculate(time=1.95, checkpoint_time=[0, 1], legacy_format=False)
+
+    assert np.allclose(result.times, [0.1, 1.1, 2.0])
+    expected_A = 1 / 3 + (2 / 3) * np.exp(-0.75 * result.times)
+    assert np.allclose(result.C[:, 0], expected_A, atol=1e-5)
+
+
+def test_adaptive_method_returns_kinetic_result(simple_environment):
+    """Test that adaptive methods report interpolated checkpoints in a KineticResult."""
+    pytest.importorskip("scipy")
+    kc = KineticalCalculator(method="LSODA")
+    kc.fit(simple_environment)
+    result = kc.calculate(time=2.0, checkpoint_time=[1.0, 3.0], plot=False, legacy_format=False)
+
+    assert np.allclose(result.times, [1.0, 2.0])
+    assert result.C.shape == (2, 2)
+
+
+def test_rate_reuse_stays_within_tolerance(multi_reaction_environment):
+    """Test that reusing rates of slowly changing reactions stays close to the exact result."""
+    pytest.importorskip("numba")
+    exact = KineticalCalculator(accuracy=1e-3)
+    exact.fit(multi_reaction_environment)
+    reused = KineticalCalculator(accuracy=1e-3, reuse_tolerance=1e-4)
+    reused.fit(multi_reaction_environment)
+
+    expected = exact.calculate(time=20.0, checkpoint_time=[5.0], plot=False)
+    results = reused.calculate(time=20.0, checkpoint_time=[5.0], plot=False)
+
+    assert 0 < reused.recompute_fraction < 1
+    for a, b in zip(results, expected):
+        assert np.allclose(a, b, rtol=1e-3, atol=1e-6)
+
+
+def test_rate_reuse_auto_disables_itself_on_irreversible_reactions():
+    """Test that "auto" stops reusing once every evaluated rate has to be recomputed."""
+    pytest.importorskip("numba")
+    A = Compound("A")
+    B = Compound("B")
+    C = Compound("C")
+    rxn1 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": A, "rate_dependency": 1}],
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [1.0], [0.0], K=1.0, kf=0.5, kb=0
+    )
+    rxn2 = Reaction(
+        [{"stoichiometric_coefficient": 1, "compound": B, "rate_dependency": 1}],
+        [{"stoichiometric_coefficient": 1, "compound": C, "rate_dependency": 1}],
+        [0.0], [0.0], K=1.0, kf=0.3, kb=0
+    )
+    kc = KineticalCalculator(accuracy=1e-3, reuse_tolerance="auto")
+    kc.fit(Enviroment(rxn1, rxn2, T=298))
+    kc.calculate(time=1.0)
+
+    assert kc.recompute_fraction > 0.9
+    assert kc._reuse[0] == 0.0
+
+
+def test_rate_reuse_invalid_tolerance():
+    """Test that a negative or non-numeric reuse_tolerance raises ValueError."""
+    with pytest.raises(ValueError, match="`reuse_tolerance` must be"):
+        KineticalCalculator(reuse_tolerance=-1.0)
+    with pytest.raises(ValueError, match="`reuse_tolerance` must be"):
+        KineticalCalculator(reuse_tolerance="always")